@@ -8,10 +8,6 @@ based on an input specification.
 # The default name for the application.
 __name__ = 'agtool'
 
-# The date the application was first created.
-__created__ = '2019-10-10'
-
-# The current version number, and a date for this version.
-# TODO: extract this from git.
-__version__ = '0.4.0'
-__updated__ = '2023-07-24'
+# The version metadata (the date the application was first created, and the
+# current version number and a date for this version) is kept in _version.
+from agtool._version import __created__, __version__, __updated__
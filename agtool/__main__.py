@@ -1,13 +1,15 @@
 import os
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from agtool.core import Controller
+from agtool.config import AppConfig
 from agtool.error import AGError
-from agtool.helpers.cli import get_app_info, parse_cli_args
-from agtool.helpers.file import read_file_as_string, replace_file_extension, write_file_from_data, \
-    write_stdout_from_data
+from agtool.helpers.cli import get_app_info, normalize_output, parse_cli_args
+from agtool.helpers.file import extract_extension, open_file_as_stream, write_file_from_data, write_stdout_from_data
 
+if TYPE_CHECKING:
+    from agtool.core import Controller
+    from agtool.struct.graph import Graph
 
 # Welcome to the main executable file for this project. This launches the CLI
 # application in agtool's "default form factor" (as opposed to being a web or
@@ -17,9 +19,12 @@ from agtool.helpers.file import read_file_as_string, replace_file_extension, wri
 # root). For more information, please refer to README.md at the root of the
 # repository.
 
+_BASE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+"""The path to the repository root (i.e., the parent of the agtool package)."""
+
 
 def main(argv=None):
-    controller: Optional[Controller] = None
+    controller: Optional['Controller'] = None
 
     try:
         # Process the specified arguments by including the system arguments, or
@@ -32,140 +37,158 @@ def main(argv=None):
         # Read information about the CLI application.
         app_info = get_app_info()
 
+        # Import the controller (and, in turn, the logger and plugin
+        # interfaces) only once the arguments have been parsed, so that
+        # --help and --version don't pay for the import.
+        from agtool.core import Controller
+
         # Start the controller for dependency injection.
         controller = Controller(
             app_info=app_info,
             config=config,
             standalone=True,
-            base_path=os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+            base_path=_BASE_PATH
         )
 
-        # Explicitly boot the controller.
-        controller.boot()
-
         # Execute the relevant commands.
+        # The controller boots (loading plugins) on first use of the plugin
+        # registry, so the checks that don't require plugins should happen
+        # before any plugins are requested.
 
-        # First, check if an override_action is set and handle it.
-        if config.override_action:
-            # List all plugins.
-            if config.override_action == 'list_plugins':
-                if config.output_format == 'json':
-                    write_stdout_from_data(controller.plugins.render_plugins_json())
-                else:
-                    write_stdout_from_data("\n")
-                    write_stdout_from_data(controller.plugins.render_plugins_table())
-                write_stdout_from_data("\n")
-
-            # Exit after handling the override action.
+        # First, check if an override_action is set and handle it. If it is,
+        # exit after handling the override action.
+        if _handle_override_action(controller, config):
             exit(0)
 
-        # Check if the input file exists.
-        if not os.path.exists(config.input_file):
-            raise AGError(f"Input file \"{config.input_file}\" does not exist.")
-
         # Now, process the given input file.
+        graph = _read_input(controller, config)
 
-        # If input_format is not specified, try to infer it from the file
-        # extension.
-        config.input_format = config.input_format if config.input_format else \
-            os.path.splitext(config.input_file)[1][len(os.extsep):]
-        # Get the file extension (e.g., '.txt') splitExt[1] (arg0 is the filename
-        # without the extension). Then, remove the leading extension separator
-        # by slicing the string after len(os.extsep).
-
-        # Identify the relevant AGReader for the file format.
-        reader = controller.reader_for(config.input_format)
-        controller.logger.info(
-            f"Using reader \"{reader.name}\" ({reader.version}) for "
-            f"input file \"{os.path.basename(config.input_file)}\" (kind: {config.input_format})."
-        )
-
-        # Read the graph from the input file.
-        graph = reader.read_graph(config.input_file, read_file_as_string(
-            config.input_file,
-            working_dir=os.getcwd()
-        ))
-
-        # Identify the output file extension (if one was specified).
-        output_file_ext = os.path.splitext(config.output_file)[1][len(os.extsep):] \
-            if config.output_file else ""
-
-        # Normalize the output file and format.
-        if config.output_format and config.output_file:
-            # If the output_file is specified (i.e., not empty) but does not have
-            # a file extension, then we'll append the output_format to the
-            # output_file (provided it is not a URI).
-            if len(output_file_ext) == 0 and ('://' not in config.output_file):
-                config.output_file = replace_file_extension(config.output_file, config.output_format)
-
-            # If we have both the output_format and the output_file, then we'll
-            # use the output_file as-is, but provide a warning to the user if the
-            # output_format doesn't match the file extension.
-            if config.output_format != output_file_ext:
-                controller.logger.warning(
-                    f"Output file \"{config.output_file}\" does not match the "
-                    f"output format \"{config.output_format}\"."
-                )
-
-                controller.logger.warning(
-                    f"We'll use the output file name as-is ({config.output_file}) and produce a file"
-                    f"with the specified format ({config.output_format}), but this may be unexpected."
-                )
-        elif config.output_format and not config.output_file:
-            # If the output_format is specified, but the output_file is not, then
-            # we'll just use the input_file with the output_format as the
-            # output_file extension.
-            config.output_file = replace_file_extension(config.input_file, config.output_format)
-        elif not config.output_format:
-            # If output_format is not specified, try to infer it from the file
-            # extension.
-            config.output_format = config.output_format if config.output_format else output_file_ext
-
-            # If there is no output_format, we'll throw an error.
-            if len(config.output_format) == 0:
-                raise AGError("No output format specified (and the output filename does not have an extension).")
-        else:
-            # If we get here, then we have neither the output_format nor the
-            # output_file, so we'll throw an error. (This shouldn't happen because
-            # a valid output format should be specified by the CLI parser.)
-            # But, if the user is using the API, or the parser is changed, this
-            # could happen, so we'll handle it.
-            raise AGError("No output format specified (and no output filename was specified so none could be"
-                          "inferred).")
-
-        # Identify the relevant AGWriter for the file format.
-        writer = controller.writer_for(config.output_format)
-        controller.logger.info(
-            f"Using writer \"{writer.name}\" ({writer.version}) for "
-            f"output file \"{os.path.basename(config.output_file)}\" (kind: {config.output_format})."
-        )
+        # Then, determine where (and in what format) to write the output.
+        _resolve_output_format(controller, config)
 
-        # Produce the output data.
-        output_data = writer.write_graph(graph, destination_label=config.output_file)
-
-        # Attempt to write the output data to the output file.
-        try:
-            if config.output_file.startswith("stdout://"):
-                # If the output file is stdout://, then we'll write to standard
-                # output.
-                write_stdout_from_data(output_data)
-            else:
-                # Otherwise, we'll write to a file.
-                write_file_from_data(config.output_file, output_data, working_dir=os.getcwd())
-                controller.logger.success(f"Successfully wrote to output file: "
-                                          f"{config.output_file} (kind: {config.output_format})")
-        except PermissionError:
-            controller.logger.error("There was a permission error when writing to the output file.")
-            controller.logger.error("If this is unexpected, is the file in use?")
-            raise AGError(f"Permission denied when writing to output file: {config.output_file}")
+        # Finally, write the graph in the output format.
+        _write_output(controller, config, graph)
 
     except AGError as error:
         if controller is not None:
-            controller.logger.error("A fatal error occurred, halting...")
-            controller.logger.error(error)
+            controller.logger_for(None).error("A fatal error occurred, halting...")
+            controller.logger_for(None).error(error)
         else:
             print(f"A fatal error occurred.\n\n{error}", file=sys.stderr)
 
 
+def _handle_override_action(controller: 'Controller', config: AppConfig) -> bool:
+    """
+    Performs the override action specified in the configuration, if there is
+    one.
+
+    :return: True if an override action was specified (in which case the
+    application should exit), otherwise False.
+    """
+
+    if not config.override_action:
+        return False
+
+    # List all plugins.
+    if config.override_action == 'list_plugins':
+        if config.output_format == 'json':
+            controller.plugins.write_plugins_json(sys.stdout)
+        else:
+            write_stdout_from_data("\n")
+            controller.plugins.write_plugins_table(sys.stdout)
+        write_stdout_from_data("\n")
+
+    return True
+
+
+def _read_input(controller: 'Controller', config: AppConfig) -> Optional['Graph']:
+    """
+    Reads the graph from the input file specified in the configuration, using
+    the reader for the input format (which is inferred from the file
+    extension if it is not specified).
+    """
+
+    # Check if the input file exists (before booting the controller to find
+    # a reader for it).
+    if not os.path.exists(config.input_file):
+        raise AGError(f"Input file \"{config.input_file}\" does not exist.")
+
+    # If input_format is not specified, try to infer it from the file
+    # extension.
+    config.input_format = config.input_format if config.input_format else \
+        extract_extension(config.input_file)
+
+    # Identify the relevant AGReader for the file format.
+    reader = controller.reader_for(config.input_format)
+
+    controller.logger_for(None).info(
+        f"Using reader \"{reader.name}\" ({reader.version}) for "
+        f"input file \"{os.path.basename(config.input_file)}\" (kind: {config.input_format})."
+    )
+
+    # Read the graph from the input file (streaming the file to the reader).
+    with open_file_as_stream(config.input_file, working_dir=os.getcwd()) as input_stream:
+        return reader.read_graph_stream(config.input_file, input_stream)
+
+
+def _resolve_output_format(controller: 'Controller', config: AppConfig) -> None:
+    """
+    Normalizes the output file and format in the configuration, and checks
+    that the output file can be written to.
+    """
+
+    # Normalize the output file and format.
+    normalize_output(config, controller.logger_for(None))
+
+    # Check that the output file can be written to before doing any work to
+    # produce the output data. (Writing the file may still fail, e.g., if
+    # the permissions change in the meantime, which is handled when writing.)
+    if not config.output_file.startswith("stdout://"):
+        output_file_path = os.path.abspath(config.output_file)
+        output_dir = os.path.dirname(output_file_path)
+
+        if not os.path.isdir(output_dir):
+            raise AGError(f"Output directory does not exist: {output_dir}")
+        if not os.access(output_dir, os.W_OK):
+            raise AGError(f"Permission denied when writing to output directory: {output_dir}")
+        if os.path.exists(output_file_path) and not os.access(output_file_path, os.W_OK):
+            raise AGError(f"Permission denied when writing to output file: {config.output_file}")
+
+
+def _write_output(controller: 'Controller', config: AppConfig, graph: Optional['Graph']) -> None:
+    """
+    Writes the graph to the output file specified in the configuration, using
+    the writer for the output format.
+    """
+
+    # Identify the relevant AGWriter for the file format.
+    writer = controller.writer_for(config.output_format)
+
+    controller.logger_for(None).info(
+        f"Using writer \"{writer.name}\" ({writer.version}) for "
+        f"output file \"{os.path.basename(config.output_file)}\" (kind: {config.output_format})."
+    )
+
+    # Produce the output data (as chunks, so it can be written out as it is
+    # produced).
+    output_data = writer.write_graph_buffered(graph, destination_label=config.output_file)
+
+    # Attempt to write the output data to the output file.
+    try:
+        if config.output_file.startswith("stdout://"):
+            # If the output file is stdout://, then we'll write to standard
+            # output.
+            write_stdout_from_data(output_data)
+        else:
+            # Otherwise, we'll write to a file.
+            write_file_from_data(config.output_file, output_data, working_dir=os.getcwd())
+            controller.logger_for(None).success(f"Successfully wrote to output file: "
+                                                f"{config.output_file} (kind: {config.output_format})")
+    except PermissionError:
+        controller.logger_for(None).error("There was a permission error when writing to the output file.")
+        controller.logger_for(None).error("If this is unexpected, is the file in use?")
+        raise AGError(f"Permission denied when writing to output file: {config.output_file}")
+
+
 if __name__ == '__main__':
     main()
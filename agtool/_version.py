@@ -0,0 +1,14 @@
+"""
+The version metadata for agtool.
+
+This module has no imports (and no side effects), so that the version
+information can be read without loading any other part of agtool.
+"""
+
+# The date the application was first created.
+__created__ = '2019-10-10'
+
+# The current version number, and a date for this version.
+# TODO: extract this from git.
+__version__ = '0.4.0'
+__updated__ = '2023-07-24'
@@ -2,7 +2,9 @@
 
 from abc import ABC, abstractmethod
 
-from agtool.abstract import AbstractPluginRegistry
+from typing import Optional
+
+from agtool.abstract import AbstractPlugin, AbstractPluginRegistry
 from agtool.config import AppConfig
 from agtool.helpers.logger import LoggerType
 
@@ -14,9 +16,23 @@ class AbstractController(ABC):
     controller module directly which could cause circular imports.
     """
 
+    __slots__ = ()
+
     logger: LoggerType
     """The application-wide logger."""
 
+    @abstractmethod
+    def logger_for(self, plugin: Optional[AbstractPlugin]) -> LoggerType:
+        """
+        Returns the logger that should be used by the given plugin (i.e., a
+        logger bound to the plugin's ID), or the application-wide logger if
+        `plugin` is None.
+
+        Unlike `logger`, this does not need to inspect the call stack to
+        determine whether it is being called from within a plugin, so this
+        should be preferred where the caller is known.
+        """
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -1,7 +1,8 @@
 # DO NOT IMPORT THIS FILE DIRECTLY. IMPORT FROM agtool.abstract INSTEAD.
 
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from functools import cached_property
+from typing import Type, TypeVar
 
 AbstractPluginExtensionGeneric = TypeVar('AbstractPluginExtensionGeneric')
 
@@ -9,7 +10,12 @@ AbstractPluginExtensionGeneric = TypeVar('AbstractPluginExtensionGeneric')
 class AbstractPlugin(ABC):
     """An abstract base class for all plugins."""
 
-    @property
+    # Plugins are free to keep their own (instance) state, and `id` and `name`
+    # are cached on the instance, so concrete plugins retain a __dict__. This
+    # just avoids adding another one for the abstract base class.
+    __slots__ = ()
+
+    @cached_property
     def id(self):
         """
         The ID (class name) of the plugin.
@@ -21,12 +27,20 @@ class AbstractPlugin(ABC):
         name notation).
 
         Your ID should also be in lowercase.
+
+        The ID is computed once, on first access, and cached on the plugin
+        instance.
         """
-        return self.__class__.__name__.lower()
+        return type(self).__name__.lower()
 
-    @property
+    @cached_property
     def name(self) -> str:
-        """The name of the plugin"""
+        """
+        The name of the plugin
+
+        Like `id`, the name is computed once, on first access, and cached on
+        the plugin instance.
+        """
 
         # Returns the id by default.
         return self.id
@@ -48,7 +62,8 @@ class AbstractPlugin(ABC):
 
     @abstractmethod
     def load_all_extensions(self,
-                            subclass_of: AbstractPluginExtensionGeneric) -> list[AbstractPluginExtensionGeneric]:
+                            subclass_of: Type[AbstractPluginExtensionGeneric])\
+            -> list[Type[AbstractPluginExtensionGeneric]]:
         """
         See `agtool.abstract.plugin_registry.AbstractPluginRegistry.load_all_extensions`
         """
@@ -56,7 +71,8 @@ class AbstractPlugin(ABC):
     @abstractmethod
     def load_extension_from_file(self,
                                  file: str,
-                                 subclass_of: AbstractPluginExtensionGeneric) -> list[AbstractPluginExtensionGeneric]:
+                                 subclass_of: Type[AbstractPluginExtensionGeneric])\
+            -> list[Type[AbstractPluginExtensionGeneric]]:
         """
         See `agtool.abstract.plugin_registry.AbstractPluginRegistry.load_extension_from_file`
         """
@@ -1,7 +1,8 @@
 # DO NOT IMPORT THIS FILE DIRECTLY. IMPORT FROM agtool.abstract INSTEAD.
 
 from abc import ABC, abstractmethod
-from typing import List, Type
+from io import StringIO
+from typing import List, Optional, TextIO, Type
 
 from agtool.abstract import AbstractPlugin, AbstractPluginExtensionGeneric, AbstractPluginGeneric
 
@@ -13,7 +14,41 @@ class AbstractPluginRegistry(ABC):
 
     @abstractmethod
     def load_all_plugins(self):
-        """Load all plugins (recursively) from the plugins directory."""
+        """
+        Load all plugins (recursively) from the plugins directory, as well as
+        any plugins provided by installed packages. This does nothing if all
+        plugins have already been loaded.
+
+        The methods that enumerate plugins (`get_plugins_of_type`,
+        `get_plugins_of_exact_type`, `get_all_plugins` and the `write_plugins_*`
+        and `render_plugins_*` methods) call this first, so that they always
+        return every available plugin (rather than just those loaded so far).
+        """
+
+    @abstractmethod
+    def load_all_plugins_cached(self, force_refresh: bool = False):
+        """
+        Load the index of available plugins from the plugin cache, falling
+        back to `load_all_plugins` if there is no usable cache.
+
+        Plugin files that are unchanged since the cache was written are not
+        loaded until a plugin they provide is requested (see
+        `load_plugins_of_format`). New or modified files are loaded
+        immediately.
+
+        :param force_refresh: If True, the cache is ignored and all plugins
+        are loaded (and the cache rewritten).
+        """
+
+    @abstractmethod
+    def load_plugins_of_format(self, plugin_type: Type[AbstractPluginGeneric], format_name: str) -> bool:
+        """
+        Load any indexed (but not yet loaded) plugins that implement the given
+        type and declare support for the given format.
+        :param plugin_type: The type of plugin to load (e.g., AGReader).
+        :param format_name: The format the plugin should support (e.g., 'txt').
+        :return: True if any plugins were loaded, False otherwise.
+        """
 
     @abstractmethod
     def load_plugin_from_file(self, file: str) -> bool:
@@ -33,7 +68,7 @@ class AbstractPluginRegistry(ABC):
     @abstractmethod
     def load_all_extensions(self,
                             plugin: AbstractPlugin,
-                            subclass_of: AbstractPluginExtensionGeneric)\
+                            subclass_of: Type[AbstractPluginExtensionGeneric])\
             -> list[Type[AbstractPluginExtensionGeneric]]:
         """
         Loads all extension _classes_ that are subclasses of the given class.
@@ -56,7 +91,7 @@ class AbstractPluginRegistry(ABC):
     def load_extension_from_file(self,
                                  plugin: AbstractPlugin,
                                  file: str,
-                                 subclass_of: AbstractPluginExtensionGeneric)\
+                                 subclass_of: Type[AbstractPluginExtensionGeneric])\
             -> list[Type[AbstractPluginExtensionGeneric]]:
         """
         Loads any extensions from the given file (subclasses of the given class).
@@ -104,6 +139,28 @@ class AbstractPluginRegistry(ABC):
         :return: A list of plugins of the given type.
         """
 
+    @abstractmethod
+    def get_plugin_for_format(self,
+                              plugin_type: Type[AbstractPluginGeneric],
+                              format_name: str) -> Optional[AbstractPluginGeneric]:
+        """
+        Get the (loaded) plugin of the specified type that supports the given
+        format (i.e., where its `default_file_extension` matches the format,
+        ignoring case).
+        :param plugin_type: The type of plugin to get (e.g., AGReader).
+        :param format_name: The name of the format (e.g., 'txt').
+        :return: The plugin, or None if no loaded plugin supports the format.
+        """
+
+    @abstractmethod
+    def get_formats_of_type(self, plugin_type: Type[AbstractPluginGeneric]) -> List[str]:
+        """
+        Get the formats supported by the plugins of the specified type
+        (including indexed plugins that have not yet been loaded).
+        :param plugin_type: The type of plugin (e.g., AGReader).
+        :return: A sorted list of the (lower-cased) format names.
+        """
+
     @abstractmethod
     def get_all_plugins(self) -> List[AbstractPlugin]:
         """
@@ -112,15 +169,37 @@ class AbstractPluginRegistry(ABC):
         """
 
     @abstractmethod
+    def write_plugins_table(self, out: TextIO) -> None:
+        """
+        Writes an ASCII table of all plugins in the registry to the given
+        stream (as it is rendered).
+        :param out: The stream to write the table to (e.g., sys.stdout).
+        """
+
+    @abstractmethod
+    def write_plugins_json(self, out: TextIO) -> None:
+        """
+        Writes a JSON representation of all plugins in the registry to the
+        given stream (as it is rendered).
+        :param out: The stream to write the JSON to (e.g., sys.stdout).
+        """
+
     def render_plugins_table(self) -> str:
         """
         Renders an ASCII table of all plugins in the registry.
+        See also `write_plugins_table`.
         :return: The ASCII table of plugins, as a string.
         """
+        out = StringIO()
+        self.write_plugins_table(out)
+        return out.getvalue()
 
-    @abstractmethod
     def render_plugins_json(self) -> str:
         """
         Renders a JSON representation of all plugins in the registry.
+        See also `write_plugins_json`.
         :return: The JSON representation of plugins, as a string.
         """
+        out = StringIO()
+        self.write_plugins_json(out)
+        return out.getvalue()
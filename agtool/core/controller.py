@@ -1,9 +1,7 @@
-import inspect
 import os.path
 import sys
-from datetime import datetime
+import time
 from typing import Optional
-from loguru import logger as loguru
 
 from agtool.abstract import AbstractController, AbstractPluginRegistry
 from agtool.config import AppConfig, AppSupportedLogLevels
@@ -14,12 +12,23 @@ from agtool.interfaces.plugin import AGPlugin
 from agtool.interfaces.reader import AGReader
 from agtool.interfaces.writer import AGWriter
 
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+"""The abbreviated month names used in timestamps."""
+
+_DEBUG_LEVEL_INDEX = AppSupportedLogLevels.index("DEBUG")
+"""The index of the DEBUG log level in AppSupportedLogLevels."""
+
 
 class Controller(AbstractController):
     """
     The application controller.
     """
 
+    __slots__ = (
+        '_name', '_version', '_description', '_config', '_standalone', 'base_path',
+        '_plugins_dir', '_plugins', '_logger', '_ready_state', '_debug',
+    )
+
     @property
     def logger(self) -> LoggerType:
         """
@@ -28,34 +37,60 @@ class Controller(AbstractController):
         This is a copy of loguru that has had the application name and metadata
         bound to it.
 
-        If this is called from within a plugin, the logger will be automatically
-        bound to the plugin's ID.
+        If this is called directly from a method of a plugin, the logger will
+        be automatically bound to the plugin's ID. This requires inspecting the
+        calling stack frame, so where the caller is known, `logger_for` (or
+        `AGPlugin.log` from within a plugin) should be used instead.
         """
 
-        # Read the previous stack frame and fetch the locals from it.
-        stack_frame = inspect.currentframe()
+        # If the calling frame is for a method with 'self' as its first
+        # argument (checked on the code object first, to avoid materializing
+        # the frame's locals where possible), and 'self' is an AGPlugin, then
+        # we'll use its ID as the logger name (i.e., a plugin-specific logger).
+        stack_frame = sys._getframe(1)
+        frame_code = stack_frame.f_code
+        if frame_code.co_argcount > 0 and frame_code.co_varnames[0] == 'self':
+            caller = stack_frame.f_locals.get('self')
+            if isinstance(caller, AGPlugin):
+                return self.logger_for(caller)
 
-        prev_stack_frame = stack_frame.f_back
-        while prev_stack_frame is not None:
-            prev_stack_locals = prev_stack_frame.f_locals
+        # Otherwise, we'll just use the application name (i.e., the
+        # application-wide logger).
+        return self._app_logger
 
-            # If there's a 'self' in the previous stack frame, and it's an
-            # AGPlugin, then we'll use its ID as the logger name (i.e., a
-            # plugin-specific logger).
-            if 'self' in prev_stack_locals:
-                caller = prev_stack_frame.f_locals['self']
-                if issubclass(caller.__class__, AGPlugin):
-                    # Render up to 20 characters of the plugin ID.
-                    # The name field in the logger is limited to 30 characters, so
-                    # we'll limit the plugin ID to 20 characters to leave room for
-                    # the "(plugin)" suffix.
-                    name = f"{caller.id[:20]} (plugin)"
-                    return loguru.bind(name=name)
+    def logger_for(self, plugin: Optional[AGPlugin]) -> LoggerType:
+        # If there's no plugin, use the application name (i.e., the
+        # application-wide logger).
+        if plugin is None:
+            return self._app_logger
+
+        # The bound logger is cached on the plugin, so it only needs to be
+        # created once.
+        plugin_logger = getattr(plugin, '_cached_logger', None)
+        if plugin_logger is None:
+            # Render up to 20 characters of the plugin ID.
+            # The name field in the logger is limited to 30 characters, so
+            # we'll limit the plugin ID to 20 characters to leave room for
+            # the "(plugin)" suffix.
+            name = f"{plugin.id[:20]} (plugin)"
+            plugin_logger = plugin._cached_logger = self._app_logger.bind(name=name)
+
+        return plugin_logger
 
-            prev_stack_frame = prev_stack_frame.f_back
+    @property
+    def _app_logger(self) -> LoggerType:
+        """
+        The application-wide logger (i.e., loguru, bound to the application
+        name).
+
+        In standalone mode, this is set up when the controller is initialized.
+        Otherwise, loguru is only imported (and bound) when the logger is first
+        used.
+        """
+        if self._logger is None:
+            from loguru import logger as loguru
+            self._logger = loguru.bind(name=self._name)
 
-        # Otherwise, we'll just use the application name (i.e., the
-        # application-wide logger).
         return self._logger
 
     @property
@@ -64,7 +99,7 @@ class Controller(AbstractController):
         if not self.has_booted:
             self.boot()
 
-        return AppSupportedLogLevels.index(self.config.verbosity) <= AppSupportedLogLevels.index("DEBUG")
+        return self._debug
 
     @property
     def name(self) -> str:
@@ -80,7 +115,12 @@ class Controller(AbstractController):
 
     @property
     def timestamp(self) -> str:
-        return datetime.now().strftime("%b/%d/%Y %-I:%M:%S %p")
+        # Formatted by hand (equivalent to "%b/%d/%Y %-I:%M:%S %p"), as %-I
+        # is not portable and this avoids the locale-aware strftime path.
+        now = time.localtime()
+        return f"{_MONTHS[now.tm_mon - 1]}/{now.tm_mday:02d}/{now.tm_year} " \
+               f"{(now.tm_hour - 1) % 12 + 1}:{now.tm_min:02d}:{now.tm_sec:02d} " \
+               f"{'AM' if now.tm_hour < 12 else 'PM'}"
 
     @property
     def config(self) -> AppConfig:
@@ -123,6 +163,12 @@ class Controller(AbstractController):
         self._config = config
         """The application's current configuration"""
 
+        self._debug = AppSupportedLogLevels.index(config.verbosity) <= _DEBUG_LEVEL_INDEX
+        """
+        Whether the application is running with debug (or more verbose)
+        logging. This is computed once from the configured verbosity.
+        """
+
         self._standalone = standalone
         """
         Whether the application should run in standalone mode (e.g.,
@@ -139,18 +185,29 @@ class Controller(AbstractController):
         # If root_path is specified, it is assumed to be the path to the
         # repository root (i.e., the parent of the bin/ directory).
         # Otherwise, we'll resolve relative to the current working directory.
-        plugins_dir = os.path.abspath(f"{base_path}/{config.plugins_dir}"
-                                      if base_path
-                                      else config.plugins_dir)
-
-        # Initialize the plugin registry.
-        from agtool.core.plugin_registry import AGPluginRegistry
-        self._plugins = AGPluginRegistry(self, plugins_dir)
+        self._plugins_dir = os.path.abspath(f"{base_path}/{config.plugins_dir}"
+                                            if base_path
+                                            else config.plugins_dir)
+        """The resolved path to the plugins directory."""
+
+        # The plugin registry is not initialized until the application boots
+        # (which happens on first use of the plugin registry, if boot() isn't
+        # called explicitly), so that no plugin loading work is done unless it
+        # is needed.
+        self._plugins: Optional[AbstractPluginRegistry] = None
         """The application's plugin registry"""
 
+        self._logger: Optional[LoggerType] = None
+        """The application-wide logger (see `_app_logger`)."""
+
         # If we're running in standalone mode, start up the application
         # components.
         if standalone:
+            # loguru is only imported here (or on first use of the logger), so
+            # that embedding the controller doesn't pay for the import up
+            # front.
+            from loguru import logger as loguru
+
             # Start up logging (colored console logging goes to standard error
             # per convention). Logging can also be set up to go to a file.
             loguru.remove()
@@ -178,10 +235,14 @@ class Controller(AbstractController):
         # Mark ready state as 1 (booting).
         self._ready_state = 1
 
-        self._logger.info(f"Starting {self._name} {self._version}...")
+        self._app_logger.info(f"Starting {self._name} {self._version}...")
+
+        # Initialize the plugin registry.
+        from agtool.core.plugin_registry import AGPluginRegistry
+        self._plugins = AGPluginRegistry(self, self._plugins_dir)
 
-        # Load plugins.
-        self.plugins.load_all_plugins()
+        # Load plugins (or the index of available plugins, if it is cached).
+        self._plugins.load_all_plugins_cached(force_refresh=self._config.force_refresh_plugins)
 
         # Mark ready state as 2 (booted).
         self._ready_state = 2
@@ -193,9 +254,9 @@ class Controller(AbstractController):
 
         if ordinary:
             if exit_code == 0:
-                self._logger.info("Shutting down...")
+                self._app_logger.info("Shutting down...")
             else:
-                self._logger.error(f"Shutting down due to error ({exit_code})...")
+                self._app_logger.error(f"Shutting down due to error ({exit_code})...")
 
         exit(exit_code)
 
@@ -204,9 +265,9 @@ class Controller(AbstractController):
         Get a reader for the specified file extension or format name.
         e.g., 'txt', 'json', etc.,
 
-        For now, this is trivially found by searching through the list of
-        plugins implementing AGReader fetched from the plugin registry for one where
-        its `default_file_extension` property matches the given `format_name`.
+        This is found by looking up the plugin registry's index of plugins
+        implementing AGReader by their `default_file_extension` property, for one
+        that matches the given `format_name` (ignoring case).
         :param format_name: The name of the format (typically the file
         extension) that the reader should support.
         :return: The AGReader instance of a reader that supports the specified
@@ -218,26 +279,28 @@ class Controller(AbstractController):
         if not self.has_booted:
             self.boot()
 
-        # Fetch the reader plugins from the plugin registry.
-        readers = self.plugins.get_plugins_of_type(AGReader)
-
         # Search through the readers for one that supports the specified
-        # format.
-        for reader in readers:
-            if reader.default_file_extension == format_name:
-                return reader
+        # format. If there isn't one, it may be that the plugin providing it
+        # hasn't been loaded yet, so ask the plugin registry to load it.
+        reader = self.plugins.get_plugin_for_format(AGReader, format_name)
+        if reader is None and self.plugins.load_plugins_of_format(AGReader, format_name):
+            reader = self.plugins.get_plugin_for_format(AGReader, format_name)
+
+        if reader is not None:
+            return reader
 
         # If we get here, we didn't find a reader for the specified format.
-        raise AGMissingPluginError(f"No reader found for format '{format_name}'")
+        raise AGMissingPluginError(f"No reader found for format '{format_name}'. Available formats: "
+                                   f"{', '.join(self.plugins.get_formats_of_type(AGReader)) or '(none)'}")
 
     def writer_for(self, format_name: str):
         """
         Get a writer for the specified file extension or format name.
         e.g., 'dot', 'png', etc.,
 
-        For now, this is trivially found by searching through the list of
-        plugins implementing AGWriter fetched from the plugin registry for one where
-        its `default_file_extension` property matches the given `format_name`.
+        This is found by looking up the plugin registry's index of plugins
+        implementing AGWriter by their `default_file_extension` property, for one
+        that matches the given `format_name` (ignoring case).
         :param format_name: The name of the format (typically the file
         extension) that the writer should support.
         :return: The AGWriter instance of a writer that supports the specified
@@ -249,14 +312,17 @@ class Controller(AbstractController):
         if not self.has_booted:
             self.boot()
 
-        # Fetch the writer plugins from the plugin registry.
-        writers = self.plugins.get_plugins_of_type(AGWriter)
-
         # Search through the writers for one that supports the specified
-        # format.
-        for writer in writers:
-            if writer.default_file_extension == format_name:
-                return writer
+        # format. If there isn't one, it may be that the plugin providing it
+        # hasn't been loaded yet, so ask the plugin registry to load it.
+        writer = self.plugins.get_plugin_for_format(AGWriter, format_name)
+        if writer is None and self.plugins.load_plugins_of_format(AGWriter, format_name):
+            writer = self.plugins.get_plugin_for_format(AGWriter, format_name)
+
+        if writer is not None:
+            return writer
 
         # If we get here, we didn't find a writer for the specified format.
-        raise AGMissingPluginError(f"No writer found for format '{format_name}'")
+        raise AGMissingPluginError(f"No writer found for format '{format_name}'. Available formats: "
+                                   f"{', '.join(self.plugins.get_formats_of_type(AGWriter)) or '(none)'}")
+
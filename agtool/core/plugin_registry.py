@@ -1,16 +1,20 @@
+import hashlib
 import importlib
 import importlib.util
 import inspect
 import json
 import os
 import pkgutil
+import platform
 import sys
 import traceback
-from ast import ClassDef as AstClassDef, ImportFrom as AstImportFrom, parse as parse_ast
+from ast import Attribute as AstAttribute, ClassDef as AstClassDef, ImportFrom as AstImportFrom, Name as AstName, \
+    Subscript as AstSubscript, expr as AstExpr, parse as parse_ast
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Type, cast
+from types import ModuleType
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Type
 
-from tabulate import tabulate
 
 import agtool.interfaces
 from agtool.abstract import AbstractPluginGeneric, AbstractPluginRegistry, AbstractPluginExtensionGeneric
@@ -18,10 +22,150 @@ from agtool.core import Controller
 from agtool.error import AGPluginConflictError, AGPluginError, AGError, AGPluginLoadError, AGPluginExternalError
 from agtool.interfaces.plugin import AGPlugin
 
+_PLUGIN_CACHE_VERSION = 2
+"""
+The version of the plugin cache format. Bump this whenever the structure of
+the cache file changes to invalidate any existing caches.
+"""
+
+
+_PLUGIN_ENTRY_POINT_GROUP = 'agtool.plugins'
+"""
+The entry point group that installed packages can use to provide plugins.
+Each entry point should refer to a class that extends AGPlugin.
+"""
+
+
+_AST_CACHE: Dict[Tuple[str, int, int], dict] = {}
+"""
+An in-memory cache of the summaries of plugin source files, keyed by the
+(absolute) path, modification time (in nanoseconds) and size of the file. Each
+summary contains the list of classes declared in the file (as (name, base
+names) pairs) and the list of modules that the file imports from, so that a
+file's source need only be parsed once for as long as it is unchanged.
+"""
+
+
+_PLUGIN_MODULE_PREFIX = 'agtool._plugins.'
+"""
+The prefix for the module names given to plugin files loaded from the plugins
+directory (followed by the dotted path of the file relative to the directory).
+"""
+
+
+_INTERFACES_MODULE_PREFIX = agtool.interfaces.__name__ + '.'
+"""The prefix of the names of the modules that declare the plugin interfaces."""
+
+_PARALLEL_SCAN_THRESHOLD = 16
+"""
+The minimum number of plugin files for which a full scan reads and parses the
+files in parallel. (For fewer files, the cost of starting the threads exceeds
+any benefit.)
+"""
+
+
+_EMPTY_SOURCE_SUMMARY = {'classes': [], 'imports': []}
+"""The summary of a source file that declares no classes and imports nothing."""
+
+
+def _base_names(bases: Iterable[AstExpr]) -> Iterator[str]:
+    """
+    Yields the (unqualified) name of each of the given base class expressions
+    from a class definition. Qualified names (e.g., `module.AGReader`) yield
+    the final attribute and subscripted bases (e.g., `Generic[T]`) yield the
+    name of the subscripted class. Any other expression yields an empty
+    string (it cannot be resolved without executing the module).
+    """
+    for base in bases:
+        while isinstance(base, AstSubscript):
+            base = base.value
+
+        if isinstance(base, AstName):
+            yield base.id
+        elif isinstance(base, AstAttribute):
+            yield base.attr
+        else:
+            yield ''
+
+
+def _get_plugin_cache_path(plugins_dir: str) -> str:
+    """
+    Returns the path to the file used to cache plugin metadata between runs
+    for the given plugins directory. Each plugins directory has its own cache
+    file, named after a hash of its resolved path (so that alternating
+    between directories doesn't invalidate the cache each time).
+
+    This respects XDG_CACHE_HOME if it is set, otherwise it falls back to
+    ~/.cache (i.e., ~/.cache/agtool/plugins-<hash>.json).
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'agtool', f"plugins-{_hash_path(os.path.realpath(plugins_dir))}.json")
+
+
+def _is_plugin_filename(name: str) -> bool:
+    """
+    Returns true if a file with the given name may be a plugin file (i.e., it
+    is a Python source file that is not disabled (with a '-disabled.py'
+    suffix), private (with a leading underscore) or hidden).
+    """
+    return name.endswith('.py') and not name.endswith('-disabled.py') and name[0] not in '_.'
+
+
+def _is_plugin_dirname(name: str) -> bool:
+    """
+    Returns true if a directory with the given name may contain plugin files
+    (i.e., it is not a bytecode cache or hidden directory).
+    """
+    return name != '__pycache__' and not name.startswith('.')
+
+
+def _hash_path(path: str) -> str:
+    """Returns a short hash of the given path, for use in module names."""
+    return hashlib.sha1(path.encode('utf-8')).hexdigest()[:16]
+
+
+def _write_table(rows: Sequence[Sequence], out: TextIO) -> None:
+    """
+    Writes the given rows to the given stream as a table with a rounded
+    outline, where the first row is the header row, i.e.:
+
+    ```
+    ╭──────┬──────╮
+    │ ID   │ Type │
+    ├──────┼──────┤
+    │ ...  │ ...  │
+    ╰──────┴──────╯
+    ```
+
+    Each cell is left-aligned (and None is rendered as an empty cell), and
+    each column is at least two characters wider than its header. No newline
+    is written after the bottom border.
+    """
+    cells = [['' if value is None else str(value) for value in row] for row in rows]
+    widths = [
+        max(len(header) + 2, max((len(row[column]) for row in cells[1:]), default=0))
+        for column, header in enumerate(cells[0])
+    ]
+
+    def border(left: str, middle: str, right: str) -> str:
+        return left + middle.join('─' * (width + 2) for width in widths) + right
+
+    def line(row: List[str]) -> str:
+        return '│ ' + ' │ '.join(cell.ljust(width) for cell, width in zip(row, widths)) + ' │\n'
+
+    out.write(border('╭', '┬', '╮\n'))
+    out.write(line(cells[0]))
+    out.write(border('├', '┼', '┤\n'))
+    for row in cells[1:]:
+        out.write(line(row))
+    out.write(border('╰', '┴', '╯'))
+
 
 class _AGPluginRegistryEntry:
     """An entry in the registry for an AGPlugin."""
 
+    __slots__ = ('_plugin', '_interface', '_interface_name', '_row')
+
     def __init__(self,
                  plugin: AGPlugin,
                  interface: Type[AGPlugin]):
@@ -31,6 +175,20 @@ class _AGPluginRegistryEntry:
         self._interface = interface
         """The interface that the plugin implements."""
 
+        self._interface_name = interface.__name__
+        """The name of the interface that the plugin implements."""
+
+        # The metadata strings are interned, as they are repeated between
+        # plugins (e.g., the interface name, author and license).
+        self._row = tuple(
+            sys.intern(value) if type(value) is str else value
+            for value in (plugin.id, self._interface_name, plugin.name, plugin.version, plugin.author, plugin.license)
+        )
+        """
+        The plugin's metadata, as rendered in the plugins table (i.e., the ID,
+        type, name, version, author and license of the plugin).
+        """
+
     @property
     def plugin(self) -> AGPlugin:
         return self._plugin
@@ -39,6 +197,14 @@ class _AGPluginRegistryEntry:
     def interface(self) -> Type[AGPlugin]:
         return self._interface
 
+    @property
+    def interface_name(self) -> str:
+        return self._interface_name
+
+    @property
+    def row(self) -> Tuple[str, str, str, str, str, str]:
+        return self._row
+
 
 class AGPluginRegistry(AbstractPluginRegistry):
     """A loader and registry for plugins for agtool."""
@@ -62,124 +228,225 @@ class AGPluginRegistry(AbstractPluginRegistry):
         the plugin interface that it implements.
         """
 
-        # Ensure all the possible plugin interfaces are loaded
-        self._load_submodules(agtool.interfaces)
-        _plugin_interfaces = {}
-
-        # Iterate over all the modules in agtool.interfaces, and find all the
-        # classes that inherit from AGPlugin
-        submodules = [submodule.name for submodule in pkgutil.iter_modules(agtool.interfaces.__path__)]
-        for submodule_name in submodules:
-            # For each class, if is AGPlugin itself or a subclass of
-            # AGPlugin, add it to the set of interfaces.
-            members = inspect.getmembers(sys.modules['agtool.interfaces.' + submodule_name], inspect.isclass)
-            for member_name, member in members:
-                if issubclass(member, AGPlugin):
-                    _plugin_interfaces[member_name] = member
-
-        # Register the set of interfaces.
-        self._plugin_interfaces = _plugin_interfaces
-        """The set of interfaces that plugins can implement."""
+        self._loaded_files: Dict[str, bool] = {}
+        """
+        The set of plugin files that have already been loaded (the key is the
+        path to the file), mapped to whether the file contained any plugins.
+        This ensures that a file is never loaded (and its plugins registered)
+        more than once.
+        """
+
+        self._loaded_entry_points: set[str] = set()
+        """
+        The set of entry points (by value, e.g., 'package.module:Class') that
+        plugins have already been loaded from.
+        """
+
+        self._loaded_all_plugins = False
+        """
+        Whether a full scan of the plugins directory (see load_all_plugins) has
+        already been done, in which case there is nothing left to load.
+        """
+
+        self._scanned_entry_points = False
+        """
+        Whether the installed packages have been scanned for entry point
+        plugins yet. This is done at most once, and only when it is needed (as
+        scanning requires reading the metadata of every installed package).
+        """
+
+        self._plugins_by_type: Dict[type, List[AGPlugin]] = {}
+        """
+        An index of the registered plugins by type. Each plugin is indexed
+        under every plugin class in its MRO (so that lookups match subclasses,
+        as with isinstance), in the order that the plugins were registered.
+        """
+
+        self._plugins_by_interface: Dict[type, List[AGPlugin]] = {}
+        """
+        An index of the registered plugins by the plugin interface that they
+        were registered as implementing, in the order that the plugins were
+        registered.
+        """
+
+        self._plugins_by_format: Dict[type, Dict[str, AGPlugin]] = {}
+        """
+        An index of the registered plugins of a given type (the key), by the
+        (lower-cased) format that they support. This is maintained as plugins
+        are registered, with each plugin indexed under every plugin class in
+        its MRO (so that lookups match subclasses, as with isinstance).
+        """
+
+        self._plugin_index: Dict[str, dict] = {}
+        """
+        The index of plugin metadata for each scanned plugin file (keyed by the
+        path to the file). This is persisted to the plugin cache so that
+        subsequent runs can locate plugins without loading every plugin file.
+        """
+
+        self._plugin_index_changed = False
+        """
+        Whether the plugin index (or the cached source summaries) have changed
+        since they were last persisted.
+        """
+
+        self._plugin_cache_path = _get_plugin_cache_path(plugins_dir)
+        """The path to the file used to persist the plugin index."""
+
+        self.__plugin_interfaces: Optional[Dict[str, Type[AGPlugin]]] = None
+        """
+        The set of interfaces that plugins can implement (keyed by name). This
+        is discovered when it is first needed (see _plugin_interfaces).
+        """
+
+        self.__plugin_interface_set: Optional[frozenset[Type[AGPlugin]]] = None
+        """
+        The set of plugin interfaces (classes), used to determine which
+        interface a plugin implements by identity.
+        """
+
+        self.__plugin_interface_names: Optional[tuple[bytes, ...]] = None
+        """
+        The names of the plugin interfaces (as bytes), used to cheaply reject
+        source files that cannot declare a plugin before they are parsed.
+        """
+
+    @property
+    def _plugin_interfaces(self) -> Dict[str, Type[AGPlugin]]:
+        """
+        The set of interfaces that plugins can implement (keyed by name). The
+        interface modules are imported and scanned on first access.
+        """
+        if self.__plugin_interfaces is None:
+            self.__plugin_interfaces = self._discover_interfaces()
+
+        return self.__plugin_interfaces
+
+    @property
+    def _plugin_interface_set(self) -> frozenset[Type[AGPlugin]]:
+        """The set of plugin interfaces (classes), for identity-based lookups."""
+        if self.__plugin_interface_set is None:
+            self.__plugin_interface_set = frozenset(self._plugin_interfaces.values())
+
+        return self.__plugin_interface_set
+
+    @property
+    def _plugin_interface_names(self) -> tuple[bytes, ...]:
+        """The names of the plugin interfaces, as bytes."""
+        if self.__plugin_interface_names is None:
+            self.__plugin_interface_names = tuple(name.encode() for name in self._plugin_interfaces)
+
+        return self.__plugin_interface_names
 
     def load_all_extensions(self,
                             plugin: AGPlugin,
-                            subclass_of: AbstractPluginExtensionGeneric)\
+                            subclass_of: Type[AbstractPluginExtensionGeneric])\
             -> list[Type[AbstractPluginExtensionGeneric]]:
-        self.controller.logger.info(f"Scanning for extensions for \"{plugin.name}\" in {self.plugins_dir}...")
+        self.controller.logger_for(plugin).info(
+            f"Scanning for extensions for \"{plugin.name}\" in {self.plugins_dir}..."
+        )
 
         extensions = []
 
-        # Load all extensions from the plugins directory
-        for root, dirs, filenames in os.walk(self.plugins_dir):
-            for filename in filenames:
-                if filename.endswith(".py") \
-                        and not filename.endswith("-disabled") \
-                        and not filename.startswith("_"):
+        # Find the set of valid superclasses for the extensions (this depends
+        # only on subclass_of, so it is computed once for the whole scan).
+        valid_superclasses = self._get_extension_superclasses(subclass_of)
 
-                    # Add the extensions from the file to the list of extensions discovered.
-                    extensions.extend(self.load_extension_from_file(plugin, os.path.join(root, filename),
-                                                                    subclass_of=subclass_of))
+        # Load all extensions from the plugins directory
+        for file in self._iter_plugin_files(self.plugins_dir):
+            # Add the extensions from the file to the list of extensions discovered.
+            extensions.extend(self._load_extension_from_file(plugin, file, subclass_of, valid_superclasses))
 
         if len(extensions) > 0:
-            self.controller.logger.success(
+            self.controller.logger_for(plugin).success(
                 f"Finished loading extensions for \"{plugin.name}\". "
                 f"{len(extensions)} extension{'s are' if len(extensions) != 1 else ' is'} ready."
             )
         else:
-            self.controller.logger.info(
+            self.controller.logger_for(plugin).info(
                 f"No extensions for \"{plugin.name}\" were found."
             )
 
+        # Persist any source summaries computed whilst scanning for extensions.
+        if self._plugin_index_changed:
+            self._write_plugin_cache()
+
         return extensions
 
     def load_extension_from_file(self,
                                  plugin: AGPlugin,
                                  file: str,
-                                 subclass_of: AbstractPluginExtensionGeneric)\
+                                 subclass_of: Type[AbstractPluginExtensionGeneric])\
+            -> list[Type[AbstractPluginExtensionGeneric]]:
+        return self._load_extension_from_file(plugin, file, subclass_of,
+                                              self._get_extension_superclasses(subclass_of))
+
+    def _load_extension_from_file(self,
+                                  plugin: AGPlugin,
+                                  file: str,
+                                  subclass_of: Type[AbstractPluginExtensionGeneric],
+                                  base_superclasses: frozenset[str])\
             -> list[Type[AbstractPluginExtensionGeneric]]:
+        """
+        Implements load_extension_from_file, given the (precomputed) set of
+        names of the valid superclasses for the extensions.
+        """
 
         extensions = []
 
-        self.controller.logger.trace(f"Looking for extensions for \"{plugin.name}\" in {file}...")
+        self.controller.logger_for(plugin).trace(f"Looking for extensions for \"{plugin.name}\" in {file}...")
 
-        # Attempt to derive a spec and module from the file
-        spec = importlib.util.spec_from_file_location(file, file)
-        file_module = importlib.util.module_from_spec(spec)
+        file_module = None
+        """The module for the file, once it has been imported into the runtime."""
 
-        # Find the list of valid superclasses for the extension.
-        valid_superclasses = {subclass_of.__name__}
-        valid_superclasses = valid_superclasses.union({clazz.__name__ for clazz in subclass_of.__subclasses__()})
+        # Take a copy of the valid superclasses, as the superclasses found in
+        # this file (and the files it imports) are added to it.
+        valid_superclasses = set(base_superclasses)
 
         try:
-            file_source = parse_ast(inspect.getsource(file_module))
-            file_imported = False
-            """Whether the file has been imported into the runtime yet."""
-
-            for node in file_source.body:
-                if isinstance(node, AstImportFrom):
-                    # We only care about imports from the current plugin directory.
-                    if not node.module.startswith(os.path.basename(self.plugins_dir)):
-                        continue
-
-                    # Get the path to the module that is being imported.
-                    module_path = str(Path(os.path.dirname(self.plugins_dir)).joinpath(
-                        Path(node.module.replace(".", "/")).with_suffix(".py")
-                    ))
-
-                    # Run load_extension_from_file on that module first to ensure that all
-                    # superclasses in that module are loaded.
-                    valid_superclasses = valid_superclasses.union({
-                        clazz.__name__ for clazz in self.load_extension_from_file(plugin, module_path, subclass_of)
-                    })
-
-            for node in file_source.body:
-                # If the node is a class definition, check if one of its bases is
-                # subclass_of or a subclass of subclass_of.
-                if isinstance(node, AstClassDef):
-                    # Ignore classes where the name starts with an underscore.
-                    if node.name.startswith("_"):
-                        continue
-
-                    # Get the list of base classes.
-                    bases = [base.id for base in cast(any, node.bases)]
-
-                    if len(valid_superclasses.intersection(bases)) > 0:
-                        # Load the plugin module. If it has already been loaded,
-                        # we can skip it. If file_imported is False, we can
-                        # assume that the plugin module has not been loaded yet.
-                        if not file_imported:
-                            spec.loader.exec_module(file_module)
-
-                            # Mark that the file has been imported.
-                            file_imported = True
-
-                        # Then, add the extension to the list of extensions.
-                        extensions.append(getattr(file_module, node.name))
-
-                        # and add the extension to the list of valid_superclasses.
-                        # (Classes that are subclasses of this one, are also
-                        # by extension, subclasses of the requested class, subclass_of).
-                        valid_superclasses.add(node.name)
+            # A file can only declare an extension if it mentions one of the
+            # valid superclasses, or imports one from the plugins directory.
+            file_summary = self._get_source_summary(file, [
+                *(superclass.encode() for superclass in valid_superclasses),
+                os.path.basename(self.plugins_dir).encode()
+            ])
+
+            for module in file_summary['imports']:
+                # We only care about imports from the current plugin directory.
+                if not module.startswith(os.path.basename(self.plugins_dir)):
+                    continue
+
+                # Get the path to the module that is being imported.
+                module_path = str(Path(os.path.dirname(self.plugins_dir)).joinpath(
+                    Path(module.replace(".", "/")).with_suffix(".py")
+                ))
+
+                # Run load_extension_from_file on that module first to ensure that all
+                # superclasses in that module are loaded.
+                valid_superclasses.update(
+                    clazz.__name__
+                    for clazz in self._load_extension_from_file(plugin, module_path, subclass_of, base_superclasses)
+                )
+
+            for class_name, bases in file_summary['classes']:
+                # For each class, check if one of its bases is subclass_of or a
+                # subclass of subclass_of. Ignore classes where the name starts
+                # with an underscore.
+                if class_name.startswith("_"):
+                    continue
+
+                if any(base in valid_superclasses for base in bases):
+                    # Load the plugin module, if it has not been loaded yet.
+                    if file_module is None:
+                        file_module = self._import_plugin_module(file)
+
+                    # Then, add the extension to the list of extensions.
+                    extensions.append(getattr(file_module, class_name))
+
+                    # and add the extension to the list of valid_superclasses.
+                    # (Classes that are subclasses of this one, are also
+                    # by extension, subclasses of the requested class, subclass_of).
+                    valid_superclasses.add(class_name)
         except OSError:
             # Do nothing if the source cannot be obtained.
             pass
@@ -194,113 +461,212 @@ class AGPluginRegistry(AbstractPluginRegistry):
 
         return extensions
 
+    @staticmethod
+    def _get_extension_superclasses(subclass_of: Type[AbstractPluginExtensionGeneric]) -> frozenset[str]:
+        """
+        Returns the names of the classes that extensions (subclasses of
+        subclass_of) may directly extend; subclass_of and its subclasses.
+        """
+        return frozenset({subclass_of.__name__, *(clazz.__name__ for clazz in subclass_of.__subclasses__())})
+
     def load_all_plugins(self):
-        self.controller.logger.info(f"Scanning for plugins in {self.plugins_dir}...")
+        # If every plugin has already been loaded (e.g., because there was no
+        # usable plugin cache when the application booted), don't scan again.
+        if self._loaded_all_plugins:
+            return
+
+        self.controller.logger_for(None).info(f"Scanning for plugins in {self.plugins_dir}...")
+
+        files = list(self._iter_plugin_files())
+
+        # Read and parse the plugin files in parallel (the summaries are
+        # cached, so the loads below do not need to parse them again).
+        self._prefetch_source_summaries(files, self._plugin_interface_names)
 
         # Load all plugins from the plugins directory
-        for root, dirs, filenames in os.walk(self.plugins_dir):
-            for filename in filenames:
-                if filename.endswith(".py") \
-                        and not filename.endswith("-disabled") \
-                        and not filename.startswith("_"):
-                    # Load the plugin
-                    self.load_plugin_from_file(os.path.join(root, filename))
-
-        self.controller.logger.success(
+        for file in files:
+            # Load the plugin
+            self.load_plugin_from_file(file)
+
+        # Load any plugins provided by installed packages.
+        self._load_entry_point_plugins()
+
+        self.controller.logger_for(None).success(
             f"Finished loading plugins. "
             f"{len(self._plugins)} plugin{'s are' if len(self._plugins) != 1 else ' is'} ready."
         )
 
+        self._loaded_all_plugins = True
+
+        # Persist the (now complete) plugin index for subsequent runs.
+        self._write_plugin_cache()
+
+    def load_all_plugins_cached(self, force_refresh: bool = False):
+        # If a refresh has been requested, or there is no usable cache, fall
+        # back to a full scan (which will also write a fresh cache).
+        cached_files = None if force_refresh else self._read_plugin_cache()
+        if cached_files is None:
+            self.load_all_plugins()
+            return
+
+        self.controller.logger_for(None).info(f"Loading plugin index for {self.plugins_dir} from cache...")
+
+        # Stat each of the plugin files. Files that are unchanged since the
+        # cache was written are indexed from the cache (and loaded lazily when
+        # needed), whereas new or modified files are loaded immediately to
+        # refresh their entries.
+        for file in self._iter_plugin_files():
+            cached_entry = cached_files.get(file)
+            file_stat = os.stat(file)
+
+            if cached_entry is not None \
+                    and cached_entry['mtime_ns'] == file_stat.st_mtime_ns \
+                    and cached_entry['size'] == file_stat.st_size:
+                self._plugin_index[file] = cached_entry
+            else:
+                self.load_plugin_from_file(file)
+
+        # Plugins provided by installed packages are not loaded here, as
+        # finding them requires scanning the metadata of every installed
+        # package. Instead, they are loaded when a plugin that isn't in the
+        # index is requested (see load_plugins_of_format), or all plugins are
+        # loaded.
+
+        # Files that were in the cache but no longer exist have been dropped
+        # from the index, so the cache needs to be rewritten.
+        if len(self._plugin_index) != len(cached_files):
+            self._plugin_index_changed = True
+
+        indexed_plugins = sum(len(entry['plugins']) for entry in self._plugin_index.values())
+        self.controller.logger_for(None).success(
+            f"Finished loading plugin index. "
+            f"{indexed_plugins} plugin{'s are' if indexed_plugins != 1 else ' is'} available "
+            f"({len(self._plugins)} loaded)."
+        )
+
+        if self._plugin_index_changed:
+            self._write_plugin_cache()
+
+    def load_plugins_of_format(self, plugin_type: Type[AbstractPluginGeneric], format_name: str) -> bool:
+        loaded = False
+
+        # Locate (and load) any files in the index that declare a plugin of
+        # the requested type and format, but have not yet been loaded.
+        for file, entry in self._plugin_index.items():
+            if file in self._loaded_files:
+                continue
+
+            if any(plugin['interface'] == plugin_type.__name__
+                   and plugin['format'] is not None
+                   and plugin['format'].lower() == format_name.lower()
+                   for plugin in entry['plugins']):
+                loaded = self.load_plugin_from_file(file) or loaded
+
+        # If no plugin in the index provides the format, it may be provided by
+        # an installed package.
+        if not loaded:
+            loaded = self._load_entry_point_plugins()
+
+        # Persist any changes to the index made whilst loading the files.
+        if self._plugin_index_changed:
+            self._write_plugin_cache()
+
+        return loaded
+
     def load_plugin_from_file(self, file: str) -> bool:
-        self.controller.logger.trace(f"Looking for plugins in {file}...")
+        # If the file has already been loaded, don't load it (or register its
+        # plugins) again.
+        if file in self._loaded_files:
+            return self._loaded_files[file]
 
-        # Attempt to derive a spec and module from the file
-        spec = importlib.util.spec_from_file_location(os.path.basename(file), file)
-        file_module = importlib.util.module_from_spec(spec)
+        self.controller.logger_for(None).trace(f"Looking for plugins in {file}...")
+
+        file_module = None
+        """The module for the file, once it has been imported into the runtime."""
 
         # Load the plugin module by parsing the AST of the file to determine
         # if it contains a class that extends AGPlugin
         file_has_plugin = False
 
-        loaded_plugins = 0
-        """The number of plugins loaded from the file"""
+        loaded_plugins: List[AGPlugin] = []
+        """The plugins loaded from the file"""
 
         try:
             try:
-                file_source = parse_ast(inspect.getsource(file_module))
+                file_summary = self._get_source_summary(file, self._plugin_interface_names)
             except Exception as e:
                 raise AGPluginLoadError(f"Failed to parse source for {os.path.basename(file)}: {e}")
 
             # Then attempt to load all plugins from the file.
-            for node in file_source.body:
-                # If the node is a class definition, check if one of its bases is
-                # AGPlugin or a subclass of AGPlugin.
-                if isinstance(node, AstClassDef):
-                    # Ignore classes where the name starts with an underscore.
-                    if node.name.startswith("_"):
-                        continue
-
-                    # Otherwise, scan the class to see if it is a plugin.
-                    is_plugin = False
-                    plugin_type = None
-                    bases = [base.id for base in cast(any, node.bases)]
-
-                    if "AGPlugin" in bases:
-                        plugin_type = AGPlugin
-                        is_plugin = True
-                    else:
-                        # Search for a subclass of AGPlugin
-                        for base in bases:
-                            if self._is_plugin_superclass(base):
-                                plugin_type = self._plugin_interfaces[base]
-                                is_plugin = True
-                                break
-
-                    if is_plugin:
-                        # Load the plugin module. If it has already been loaded,
-                        # we can skip it. If file_has_plugin is False, we can
-                        # assume that the plugin module has not been loaded yet.
-                        if not file_has_plugin:
-                            spec.loader.exec_module(file_module)
-
-                            # Mark that the file contains a plugin (and has thus
-                            # been loaded)
-                            file_has_plugin = True
-
-                        # Register and instantiate the plugin.
-                        plugin_type_str = f' {plugin_type.__name__}' if plugin_type is not None else ""
-                        self.controller.logger.info(
-                            f"Attempting to initialize class {node.name} as an{plugin_type_str} plugin..."
+            for class_name, bases in file_summary['classes']:
+                # For each class, check if one of its bases is AGPlugin or a
+                # subclass of AGPlugin. Ignore classes where the name starts
+                # with an underscore.
+                if class_name.startswith("_"):
+                    continue
+
+                # Otherwise, scan the class to see if it is a plugin.
+                is_plugin = False
+                plugin_type = None
+
+                if "AGPlugin" in bases:
+                    plugin_type = AGPlugin
+                    is_plugin = True
+                else:
+                    # Search for a subclass of AGPlugin
+                    for base in bases:
+                        if self._is_plugin_superclass(base):
+                            plugin_type = self._plugin_interfaces[base]
+                            is_plugin = True
+                            break
+
+                if is_plugin:
+                    # Load the plugin module. If it has already been loaded,
+                    # we can skip it. If file_has_plugin is False, we can
+                    # assume that the plugin module has not been loaded yet.
+                    if not file_has_plugin:
+                        file_module = self._import_plugin_module(file)
+
+                        # Mark that the file contains a plugin (and has thus
+                        # been loaded)
+                        file_has_plugin = True
+
+                    # Register and instantiate the plugin.
+                    plugin_type_str = f' {plugin_type.__name__}' if plugin_type is not None else ""
+                    self.controller.logger_for(None).info(
+                        f"Attempting to initialize class {class_name} as an{plugin_type_str} plugin..."
+                    )
+
+                    # Instantiate the plugin
+                    try:
+                        plugin_class: Type[AGPlugin] = getattr(file_module, class_name)
+                        plugin: AGPlugin = plugin_class(controller=self.controller)
+
+                        # Register the plugin
+                        self.register_plugin(plugin)
+                        loaded_plugins.append(plugin)
+                    except AGError as e:
+                        raise e
+                    except Exception as e:
+                        raise AGPluginLoadError(
+                            f"Failed to initialize class {class_name} as an{plugin_type_str} plugin: {e}"
                         )
 
-                        # Instantiate the plugin
-                        try:
-                            plugin_class: Type[AGPlugin] = getattr(file_module, node.name)
-                            plugin: AGPlugin = plugin_class(controller=self.controller)
-
-                            # Register the plugin
-                            self.register_plugin(plugin)
-                            loaded_plugins += 1
-                        except AGError as e:
-                            raise e
-                        except Exception as e:
-                            raise AGPluginLoadError(
-                                f"Failed to initialize class {node.name} as an{plugin_type_str} plugin: {e}"
-                            )
-
         except AGPluginLoadError as e:
-            self.controller.logger.error(e)
-        except OSError:
-            # Do nothing if the source cannot be obtained.
-            pass
+            self.controller.logger_for(None).error(e)
 
-        if file_has_plugin and loaded_plugins > 0:
-            self.controller.logger.success(
-                f"Successfully registered {loaded_plugins} plugin{'s' if loaded_plugins != 1 else ''} from "
-                f"{os.path.basename(file)}"
+        # Mark the file as loaded, and record the plugins it contains in the
+        # plugin index.
+        self._loaded_files[file] = file_has_plugin
+        self._index_plugin_file(file, loaded_plugins)
+
+        if file_has_plugin and len(loaded_plugins) > 0:
+            self.controller.logger_for(None).success(
+                f"Successfully registered {len(loaded_plugins)} plugin{'s' if len(loaded_plugins) != 1 else ''} "
+                f"from {os.path.basename(file)}"
             )
         else:
-            self.controller.logger.trace(
+            self.controller.logger_for(None).trace(
                 f"File {os.path.basename(file)} does not contain a valid class that extends AGPlugin, skipping..."
             )
 
@@ -310,12 +676,12 @@ class AGPluginRegistry(AbstractPluginRegistry):
         if plugin.id in self._plugins:
             existing_plugin = self._plugins[plugin.id].plugin
 
-            self.controller.logger.error(
+            self.controller.logger_for(None).error(
                 f"Duplicate plugin ID '{plugin.id}' found. If this is the same "
                 f"plugin, please remove the duplicate. If this is a different "
                 f"plugin, please change the plugin ID."
             )
-            self.controller.logger.error(
+            self.controller.logger_for(None).error(
                 f"Ideally, you should change the class name such that it is "
                 f"unique, but if you cannot do that, you can override the ID "
                 f"property of the plugin class to define a custom ID."
@@ -325,17 +691,17 @@ class AGPluginRegistry(AbstractPluginRegistry):
                                                     f"({existing_plugin.name}). It cannot be registered again.")
 
         # Determine which interface the plugin implements
-        plugin_interface = None
-
-        # We compare the plugin's base classes to the plugin interfaces
-        # to determine which interface the plugin implements.
-        #
-        # This is done by name instead of with isinstance to ensure that the
-        # plugin interface is not a subclass of the plugin's base class.
-        for base in plugin.__class__.__bases__:
-            if base.__name__ in self._plugin_interfaces:
-                plugin_interface = self._plugin_interfaces[base.__name__]
-                break
+        # We search the plugin's MRO (nearest class first) for the most
+        # specific plugin interface that it implements. This matches by
+        # identity, so plugins that extend an interface via an intermediate
+        # (helper or mixin) class are also matched. AGPlugin is only used if
+        # the plugin implements no more specific interface.
+        plugin_interface_set = self._plugin_interface_set
+        plugin_mro = type(plugin).__mro__
+        plugin_interface = next(
+            (clazz for clazz in plugin_mro if clazz in plugin_interface_set and clazz is not AGPlugin),
+            AGPlugin if AGPlugin in plugin_mro else None
+        )
 
         if plugin_interface is None:
             raise AGPluginError(
@@ -350,73 +716,442 @@ class AGPluginRegistry(AbstractPluginRegistry):
             interface=plugin_interface,
         )
 
+        # Index the plugin under each plugin type that it is an instance of,
+        # along with the format that it supports (if any). Where multiple
+        # plugins support the same format, the first one registered takes
+        # precedence.
+        plugin_format = getattr(plugin, 'default_file_extension', None)
+        plugin_format = plugin_format.lower() if plugin_format is not None else None
+
+        for plugin_class in type(plugin).__mro__:
+            if issubclass(plugin_class, AGPlugin):
+                self._plugins_by_type.setdefault(plugin_class, []).append(plugin)
+
+                if plugin_format is not None:
+                    self._plugins_by_format.setdefault(plugin_class, {}).setdefault(plugin_format, plugin)
+
+        self._plugins_by_interface.setdefault(plugin_interface, []).append(plugin)
+
         plugin_type_str = f' {plugin_interface.__name__}' if plugin_interface is not AGPlugin else ""
-        self.controller.logger.info(
+        self.controller.logger_for(None).info(
             f"Registered{plugin_type_str} plugin '{plugin.name}' (version {plugin.version}) "
             f"by {plugin.author} ({plugin.license} license)"
         )
 
     def get_plugins_of_type(self, plugin_type: Type[AbstractPluginGeneric]) -> List[AbstractPluginGeneric]:
-        return [entry.plugin for entry in self._plugins.values() if isinstance(entry.plugin, plugin_type)]
+        self.load_all_plugins()
+        return list(self._plugins_by_type.get(plugin_type, ()))
 
     def get_plugins_of_exact_type(self, plugin_type: Type[AbstractPluginGeneric]) -> List[AbstractPluginGeneric]:
-        return [entry.plugin for entry in self._plugins.values() if entry.interface is plugin_type]
+        self.load_all_plugins()
+        return list(self._plugins_by_interface.get(plugin_type, ()))
+
+    def get_plugin_for_format(self,
+                              plugin_type: Type[AbstractPluginGeneric],
+                              format_name: str) -> Optional[AbstractPluginGeneric]:
+        plugins_by_format = self._plugins_by_format.get(plugin_type)
+        return plugins_by_format.get(format_name.lower()) if plugins_by_format is not None else None
+
+    def get_formats_of_type(self, plugin_type: Type[AbstractPluginGeneric]) -> List[str]:
+        # Include the formats of loaded plugins, as well as those of plugins
+        # that are in the plugin index but have not yet been loaded.
+        # (This reads the loaded plugins directly, rather than with
+        # get_plugins_of_type, so as not to load every plugin).
+        formats = {
+            plugin.default_file_extension.lower()
+            for plugin in self._plugins_by_type.get(plugin_type, ())
+            if getattr(plugin, 'default_file_extension', None) is not None
+        }
+
+        formats.update(
+            plugin['format'].lower()
+            for entry in self._plugin_index.values()
+            for plugin in entry['plugins']
+            if plugin['interface'] == plugin_type.__name__ and plugin['format'] is not None
+        )
+
+        return sorted(formats)
 
     def get_all_plugins(self) -> List[AGPlugin]:
+        self.load_all_plugins()
         return [entry.plugin for entry in self._plugins.values()]
 
-    def render_plugins_table(self) -> str:
+    def write_plugins_table(self, out: TextIO) -> None:
         registry_entries = self._get_all_registry_entries()
 
-        result = f"Registered plugins ({len(registry_entries)}):\n"
+        out.write(f"Registered plugins ({len(registry_entries)}):\n")
 
         table = [
             # Table Header Row
             ['ID', 'Type', 'Name', 'Version', 'Author', 'License']
         ]
 
-        # Loop over each plugin, and add a row to the table for each one.
-        for entry in registry_entries:
-            # The plugin instance itself (we can fetch the metadata from this)
-            plugin = entry.plugin
-            # The plugin type name (e.g., 'AGPlugin', 'AGReader', etc.,)
-            plugin_type = entry.interface.__name__
+        # Add a row to the table for each plugin (the rows are prepared when
+        # the plugins are registered).
+        table.extend(entry.row for entry in registry_entries)
 
-            table.append([
-                plugin.id, plugin_type,
-                plugin.name, plugin.version, plugin.author, plugin.license
-            ])
-
-        return (result +
-                tabulate(table, headers='firstrow', tablefmt='rounded_outline'))
+        _write_table(table, out)
 
-    def render_plugins_json(self) -> str:
+    def write_plugins_json(self, out: TextIO) -> None:
         plugins = {}
 
         for entry in self._get_all_registry_entries():
-            # Ensure there is a list for the plugin type.
-            if entry.interface.__name__ not in plugins:
-                plugins[entry.interface.__name__] = []
-
-            # Now add the plugin to the list.
-            plugins[entry.interface.__name__].append({
-                'id': entry.plugin.id,
-                'name': entry.plugin.name,
-                'version': entry.plugin.version,
-                'author': entry.plugin.author,
-                'license': entry.plugin.license,
+            plugin_id, plugin_type, name, version, author, plugin_license = entry.row
+
+            # Add the plugin to the list for its plugin type (ensuring there
+            # is a list for the plugin type).
+            plugins.setdefault(plugin_type, []).append({
+                'id': plugin_id,
+                'name': name,
+                'version': version,
+                'author': author,
+                'license': plugin_license,
             })
 
-        # Return the JSON string.
-        return json.dumps(plugins, indent=4)
+        # Write the JSON to the stream.
+        json.dump(plugins, out, indent=4)
 
     def _get_all_registry_entries(self) -> List[_AGPluginRegistryEntry]:
+        self.load_all_plugins()
         return list(self._plugins.values())
 
+    def _load_entry_point_plugins(self) -> bool:
+        """
+        Loads (and registers) any plugins provided by installed packages via
+        the 'agtool.plugins' entry point group. The installed packages are only
+        scanned the first time this is called.
+        :return: True if any plugins were registered, otherwise False.
+        """
+        if self._scanned_entry_points:
+            return False
+
+        self._scanned_entry_points = True
+        registered_plugins = len(self._plugins)
+
+        from importlib.metadata import entry_points
+
+        for entry_point in entry_points(group=_PLUGIN_ENTRY_POINT_GROUP):
+            # Skip entry points that have already been loaded.
+            if entry_point.value in self._loaded_entry_points:
+                continue
+
+            self._loaded_entry_points.add(entry_point.value)
+            self.controller.logger_for(None).trace(
+                f"Loading plugin from entry point {entry_point.name} ({entry_point.value})..."
+            )
+
+            try:
+                plugin_class = entry_point.load()
+
+                if not inspect.isclass(plugin_class) or not issubclass(plugin_class, AGPlugin):
+                    raise AGPluginLoadError(
+                        f"Entry point {entry_point.name} ({entry_point.value}) does not refer to a class that "
+                        f"extends AGPlugin."
+                    )
+
+                self.register_plugin(plugin_class(controller=self.controller))
+            except AGPluginLoadError as e:
+                self.controller.logger_for(None).error(e)
+            except AGError as e:
+                raise e
+            except Exception as e:
+                self.controller.logger_for(None).error(AGPluginLoadError(
+                    f"Failed to load plugin from entry point {entry_point.name} ({entry_point.value}): {e}"
+                ))
+
+        return len(self._plugins) > registered_plugins
+
+    def _iter_plugin_files(self, root: Optional[str] = None) -> Iterator[str]:
+        """
+        Yields the path to each candidate plugin file in the given directory
+        (recursively). If no directory is specified, the plugins directory is
+        used.
+        """
+        # Walk the tree with a stack of directories, using os.scandir so that
+        # the type of each entry is known without an additional stat.
+        pending_dirs = [root if root is not None else self.plugins_dir]
+        while pending_dirs:
+            with os.scandir(pending_dirs.pop()) as entries:
+                subdirs = []
+                for entry in entries:
+                    # Names are checked before types, so that entries that
+                    # cannot contain (or be) plugins are skipped without
+                    # checking their types.
+                    name = entry.name
+                    if _is_plugin_filename(name):
+                        if entry.is_file():
+                            yield entry.path
+                    elif _is_plugin_dirname(name) and entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+
+            # Visit the subdirectories in the order they were listed.
+            pending_dirs.extend(reversed(subdirs))
+
+    def _get_plugin_module_name(self, file: str) -> str:
+        """
+        Returns a unique (dotted) module name for the given plugin file, based
+        on its path relative to the plugins directory (e.g.,
+        'agtool._plugins.readers.txt_reader'), such that plugin files with the
+        same name in different directories do not share a module name.
+        """
+        relative_path = os.path.relpath(file, self.plugins_dir)
+        module_path = os.path.splitext(relative_path)[0].split(os.sep)
+
+        # Files outside the plugins directory cannot be named relative to it,
+        # so they are placed in a package for their directory (named by a hash
+        # of its absolute path, as the path itself is not a valid dotted module
+        # name).
+        if relative_path.startswith(os.pardir):
+            directory, file_name = os.path.split(os.path.abspath(file))
+            module_path = [f"_external_{_hash_path(directory)}", os.path.splitext(file_name)[0]]
+
+        # Files whose path isn't made of valid identifiers (e.g.,
+        # 'my-plugin.py') cannot be named by their path at all, so they are
+        # named by a hash of their (absolute) path instead.
+        if not all(part.isidentifier() for part in module_path):
+            return f"{_PLUGIN_MODULE_PREFIX}_file_{_hash_path(os.path.abspath(file))}"
+
+        return _PLUGIN_MODULE_PREFIX + '.'.join(module_path)
+
+    def _import_plugin_module(self, file: str) -> ModuleType:
+        """
+        Imports the given plugin file as a module (named per
+        `_get_plugin_module_name`), executing it only if it has not already
+        been imported. The module is registered in sys.modules, so it is shared
+        by the plugin and extension loaders (and any other registries).
+        """
+        module_name = self._get_plugin_module_name(file)
+
+        # (Module names are relative to the plugins directory, so a module
+        # with the same name may have been loaded from another plugins
+        # directory, in which case it is replaced).
+        file_module = sys.modules.get(module_name)
+        if file_module is not None and getattr(file_module, '__file__', None) == file:
+            return file_module
+
+        spec = importlib.util.spec_from_file_location(module_name, file)
+        file_module = importlib.util.module_from_spec(spec)
+
+        # Ensure the parent packages of the module exist, so that the module
+        # can be reloaded (and can use relative imports).
+        self._register_plugin_packages(module_name, file)
+
+        # The module is registered before it is executed (as the import system
+        # does), and removed again if it fails to execute.
+        sys.modules[module_name] = file_module
+        try:
+            spec.loader.exec_module(file_module)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+
+        return file_module
+
+    def _register_plugin_packages(self, module_name: str, file: str):
+        """
+        Registers a package in sys.modules for each parent of the given plugin
+        module (e.g., 'agtool._plugins' and 'agtool._plugins.readers' for
+        'agtool._plugins.readers.txt_reader'), if it has not already been
+        registered. The path of each package is the directory that contains
+        the corresponding part of the file's path (or the plugins directory,
+        for 'agtool._plugins' itself).
+        """
+        package_name = module_name
+        package_path = os.path.abspath(file)
+
+        while package_name != _PLUGIN_MODULE_PREFIX[:-1]:
+            package_name = package_name.rpartition('.')[0]
+            package_path = (os.path.dirname(package_path)
+                            if package_name != _PLUGIN_MODULE_PREFIX[:-1]
+                            else self.plugins_dir)
+
+            package = sys.modules.get(package_name)
+            if package is None:
+                package = sys.modules[package_name] = ModuleType(package_name)
+                package.__path__ = []
+
+            # (Packages may be shared by the registries for multiple plugins
+            # directories).
+            if package_path not in package.__path__:
+                package.__path__.append(package_path)
+
+    def _index_plugin_file(self, file: str, plugins: List[AGPlugin]):
+        """Records metadata for the plugins loaded from the given file in the plugin index."""
+        try:
+            file_stat = os.stat(file)
+        except OSError:
+            return
+
+        file_entry = {
+            'mtime_ns': file_stat.st_mtime_ns,
+            'size': file_stat.st_size,
+            'plugins': [{
+                'id': plugin.id,
+                'class': plugin.__class__.__name__,
+                'interface': self._plugins[plugin.id].interface_name,
+                'format': getattr(plugin, 'default_file_extension', None),
+                'version': plugin.version,
+            } for plugin in plugins],
+        }
+
+        # Only mark the index as changed if the entry differs from the one
+        # already in the index (e.g., if it was restored from the cache).
+        if self._plugin_index.get(file) != file_entry:
+            self._plugin_index[file] = file_entry
+            self._plugin_index_changed = True
+
+    def _get_source_summary(self, file: str, candidates: Iterable[bytes]) -> dict:
+        """
+        Returns the summary of the classes declared in, and the modules
+        imported by, the given plugin file. The file's source is only parsed if
+        there is no summary for the file (at its current modification time and
+        size) in the source cache.
+        :param candidates: The names (as bytes) of which at least one must
+        appear in the source for it to be worth parsing. If none of them do,
+        an empty summary is returned without parsing the file.
+        """
+        file_stat = os.stat(file)
+        cache_key = (os.path.abspath(file), file_stat.st_mtime_ns, file_stat.st_size)
+
+        file_summary = _AST_CACHE.get(cache_key)
+        if file_summary is not None:
+            return file_summary
+
+        # Read the source directly (rather than via inspect.getsource on the
+        # module) to avoid the additional linecache lookups.
+        with open(file, 'rb') as source_file:
+            source = source_file.read()
+
+        # Skip parsing files that cannot possibly declare anything of interest.
+        # (This summary is not cached as it depends on the candidates.)
+        if not any(candidate in source for candidate in candidates):
+            return _EMPTY_SOURCE_SUMMARY
+
+        file_source = parse_ast(source, filename=file)
+        file_summary = {
+            'classes': [
+                (node.name, list(_base_names(node.bases)))
+                for node in file_source.body if isinstance(node, AstClassDef)
+            ],
+            'imports': [node.module for node in file_source.body if isinstance(node, AstImportFrom)],
+        }
+
+        _AST_CACHE[cache_key] = file_summary
+        self._plugin_index_changed = True
+        return file_summary
+
+    def _prefetch_source_summaries(self, files: List[str], candidates: Iterable[bytes]):
+        """
+        Computes the source summaries for the given files (see
+        _get_source_summary) using a pool of threads, so that reading the
+        files overlaps with parsing them. This is only worthwhile for larger
+        plugin trees, so it does nothing for fewer than
+        _PARALLEL_SCAN_THRESHOLD files.
+
+        Any errors are ignored here; they are raised (and reported) when the
+        file is subsequently loaded.
+        """
+        if len(files) < _PARALLEL_SCAN_THRESHOLD:
+            return
+
+        candidates = tuple(candidates)
+
+        def prefetch(file: str):
+            try:
+                self._get_source_summary(file, candidates)
+            except Exception:
+                pass
+
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            # Consume the results to wait for all the files to be scanned.
+            for _ in executor.map(prefetch, files):
+                pass
+
+    def _read_plugin_cache(self) -> Optional[Dict[str, dict]]:
+        """
+        Reads the plugin index from the plugin cache.
+        :return: The cached index (keyed by plugin file path), or None if there
+        is no cache or it was written for a different environment (e.g., a
+        different Python version or plugins directory).
+        """
+        try:
+            with open(self._plugin_cache_path, 'r') as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(cache, dict) \
+                or cache.get('version') != _PLUGIN_CACHE_VERSION \
+                or cache.get('python') != platform.python_version() \
+                or cache.get('plugins_dir') != self.plugins_dir \
+                or not isinstance(cache.get('files'), dict):
+            self.controller.logger_for(None).debug("Plugin cache is missing or stale, ignoring it.")
+            return None
+
+        # Restore the cached source summaries (so that unchanged files need not
+        # be parsed again).
+        for file, summary in (cache.get('sources') or {}).items():
+            _AST_CACHE.setdefault((file, summary['mtime_ns'], summary['size']), {
+                'classes': [(class_name, bases) for class_name, bases in summary['classes']],
+                'imports': summary['imports'],
+            })
+
+        return cache['files']
+
+    def _write_plugin_cache(self):
+        """Persists the plugin index to the plugin cache."""
+        cache = {
+            'version': _PLUGIN_CACHE_VERSION,
+            'python': platform.python_version(),
+            'plugins_dir': self.plugins_dir,
+            'files': self._plugin_index,
+            'sources': {
+                file: {'mtime_ns': mtime_ns, 'size': size, **summary}
+                for (file, mtime_ns, size), summary in _AST_CACHE.items()
+                if file.startswith(self.plugins_dir + os.sep)
+            },
+        }
+
+        # Write to a temporary file first, then move it into place so a
+        # concurrent run never observes a partially written cache.
+        temporary_path = f"{self._plugin_cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._plugin_cache_path), exist_ok=True)
+            with open(temporary_path, 'w') as cache_file:
+                json.dump(cache, cache_file)
+            os.replace(temporary_path, self._plugin_cache_path)
+            self._plugin_index_changed = False
+        except OSError as e:
+            self.controller.logger_for(None).debug(f"Unable to write plugin cache to {self._plugin_cache_path}: {e}")
+
     def _is_plugin_superclass(self, class_name) -> bool:
         """Check if a class (by name) is a known subclass of AGPlugin."""
         return class_name in self._plugin_interfaces
 
+    def _discover_interfaces(self) -> Dict[str, Type[AGPlugin]]:
+        """Imports the agtool.interfaces modules and returns the plugin interfaces they declare."""
+        # Ensure all the possible plugin interfaces are loaded
+        self._load_submodules(agtool.interfaces)
+
+        # Walk the subclasses of AGPlugin (transitively), rather than sweeping
+        # every member of every module in agtool.interfaces for subclasses.
+        subclasses = {AGPlugin}
+        stack = [AGPlugin]
+        while stack:
+            for subclass in stack.pop().__subclasses__():
+                if subclass not in subclasses:
+                    subclasses.add(subclass)
+                    stack.append(subclass)
+
+        # Only the classes declared in agtool.interfaces (including AGPlugin
+        # itself) are interfaces. Any other subclasses are plugins that have
+        # already been loaded.
+        return {
+            subclass.__name__: subclass
+            for subclass in subclasses
+            if subclass.__module__.startswith(_INTERFACES_MODULE_PREFIX)
+        }
+
     @staticmethod
     def _load_submodules(module):
         """Import all submodules of a module, recursively."""
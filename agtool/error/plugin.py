@@ -5,7 +5,19 @@ from agtool.error import AGError
 
 
 class AGPluginError(AGError):
-    """Wrapper exception for all problems encountered by a plugin."""
+    """
+    Wrapper exception for all problems encountered by a plugin.
+
+    The default message (and the full description) of plugin errors are only
+    assembled when they are read (e.g., when the error is displayed), as
+    plugin errors are often caught and handled without ever being displayed.
+    """
+
+    _description_prefix: Optional[str] = None
+    """
+    An optional default description that precedes the (optional) extended
+    description of the error. Subclasses may set this.
+    """
 
     def __init__(self,
                  plugin_id: Optional[str],
@@ -14,13 +26,40 @@ class AGPluginError(AGError):
         self.plugin_id = plugin_id
         """The ID of the plugin that threw the error."""
 
-        default_message: str = (f"""Plugin {plugin_id} encountered an error."""
-                                if plugin_id is not None else
-                                f"""A plugin error has occurred.""")
-
-        super().__init__(message=default_message if message is None else message,
+        super().__init__(message=message,
                          description=description)
 
+    @property
+    def message(self) -> str:
+        """A human-readable description of why the error occurred."""
+        return self._message if self._message is not None else self._default_message()
+
+    @message.setter
+    def message(self, value: Optional[str]):
+        self._message = value
+
+    @property
+    def description(self) -> Optional[str]:
+        """An optional extended explanation of what caused the error."""
+        # The full description is the default description (if there is one)
+        # plus the optional extended description (if there is one).
+        if self._description_prefix is None:
+            return self._description
+
+        return self._description_prefix + (f"\n\n{self._description}"
+                                           if self._description is not None
+                                           else "")
+
+    @description.setter
+    def description(self, value: Optional[str]):
+        self._description = value
+
+    def _default_message(self) -> str:
+        """Returns the message for the error, if no message was specified."""
+        return (f"""Plugin {self.plugin_id} encountered an error."""
+                if self.plugin_id is not None else
+                f"""A plugin error has occurred.""")
+
 
 class AGPluginConflictError(AGPluginError):
     """
@@ -32,9 +71,11 @@ class AGPluginConflictError(AGPluginError):
                  plugin_id: str,
                  description: str = None):
         super().__init__(plugin_id=plugin_id,
-                         message=f"There is a conflict between {plugin_id} and another plugin.",
                          description=description)
 
+    def _default_message(self) -> str:
+        return f"There is a conflict between {self.plugin_id} and another plugin."
+
 
 class AGMissingPluginError(AGPluginError):
     """
@@ -42,18 +83,13 @@ class AGMissingPluginError(AGPluginError):
     found.
     """
 
-    def __init__(self, description: str = None):
-        # The full description is the default description plus the optional
-        # extended description (if there is one).
-        full_description = ("The requested functionality requires a plugin, "
-                            "but a suitable plugin could not be found." +
-                            (f"\n\n{description}"
-                             if description is not None
-                             else ""))
+    _description_prefix = ("The requested functionality requires a plugin, "
+                           "but a suitable plugin could not be found.")
 
+    def __init__(self, description: str = None):
         super().__init__(plugin_id=None,
                          message="A required plugin could not be found.",
-                         description=full_description)
+                         description=description)
 
 
 class AGPluginLoadError(AGPluginError):
@@ -61,18 +97,13 @@ class AGPluginLoadError(AGPluginError):
     Thrown when a plugin cannot be loaded.
     """
 
-    def __init__(self, description: str = None):
-        # The full description is the default description plus the optional
-        # extended description (if there is one).
-        full_description = ("A problem occurred whilst loading a plugin, "
-                            "and the plugin could not be loaded." +
-                            (f"\n\n{description}"
-                             if description is not None
-                             else ""))
+    _description_prefix = ("A problem occurred whilst loading a plugin, "
+                           "and the plugin could not be loaded.")
 
+    def __init__(self, description: str = None):
         super().__init__(plugin_id=None,
                          message="A plugin could not be loaded.",
-                         description=full_description)
+                         description=description)
 
 
 class AGPluginExternalError(AGPluginError):
@@ -83,9 +114,11 @@ class AGPluginExternalError(AGPluginError):
 
     def __init__(self, plugin_id: str, description: str = None, cause: Optional[Exception] = None):
         super().__init__(plugin_id=plugin_id,
-                         message=f"Plugin {plugin_id} encountered an error whilst interacting with an external "
-                                 f"resource, service or tool.",
                          description=description)
 
         self.cause = cause
         """The exception that caused this error, if there is one."""
+
+    def _default_message(self) -> str:
+        return (f"Plugin {self.plugin_id} encountered an error whilst interacting with an external "
+                f"resource, service or tool.")
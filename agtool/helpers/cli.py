@@ -1,12 +1,64 @@
-from argparse import ArgumentParser, RawDescriptionHelpFormatter
-from typing import List, NamedTuple, Sequence, Optional
+import functools
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, List, Sequence, Optional
 
 import agtool
 from agtool.config import AppConfig, AppSupportedLogLevels
 from agtool.error import AGError
-
-
-class AppInfoVersion(NamedTuple):
+from agtool.helpers.file import extract_extension, replace_file_extension
+from agtool.helpers.logger import LoggerType
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+_URI_RE = re.compile(r'^[a-z][a-z0-9+.\-]*://')
+"""Matches a URI scheme (per RFC 3986) at the start of a path, e.g., stdout://"""
+
+_CLI_DEFAULTS: dict[str, Any] = {
+    'override_action': None,
+    'level': 'INFO',
+    'plugins_dir': 'plugins/',
+    'force_refresh_plugins': False,
+    'input_format': None,
+    'output_format': 'png',
+    'input': None,
+    'output': None,
+}
+"""
+The default values of the command-line arguments (keyed by their destination).
+The 'options' argument (which is a list) is omitted, as it defaults to an
+empty list.
+"""
+
+_CLI_VALUE_OPTIONS: dict[str, str] = {
+    '-L': 'level', '--level': 'level',
+    '--plugins-dir': 'plugins_dir',
+    '-it': 'input_format', '-ifmt': 'input_format', '--input-type': 'input_format', '--input-format': 'input_format',
+    '-ot': 'output_format', '-ofmt': 'output_format', '--output-type': 'output_format',
+    '--output-format': 'output_format',
+    '-o': 'output', '--output': 'output', '--output-file': 'output',
+    '-s': 'options', '--set': 'options', '--set-option': 'options',
+}
+"""
+The command-line options that take a value, mapped to the destination of the
+value (see _get_parser). These are recognized by the fast path in
+parse_cli_args.
+"""
+
+_CLI_FLAG_OPTIONS: dict[str, tuple[str, Any]] = {
+    '-P': ('override_action', 'list_plugins'), '--list-plugins': ('override_action', 'list_plugins'),
+    '--force-refresh-plugins': ('force_refresh_plugins', True),
+}
+"""
+The command-line options that do not take a value, mapped to the destination
+and the value that is stored when the option is present (see _get_parser).
+These are recognized by the fast path in parse_cli_args.
+"""
+
+
+@dataclass(slots=True, frozen=True)
+class AppInfoVersion:
     name: str
     date: str
 
@@ -14,19 +66,27 @@ class AppInfoVersion(NamedTuple):
         return f"{self.name} ({self.date})"
 
 
-class AppInfo(NamedTuple):
+@dataclass(slots=True, frozen=True)
+class AppInfo:
     name: str
     version: AppInfoVersion
     description: List[str]
 
 
+@functools.cache
 def get_app_info() -> AppInfo:
+    """
+    Returns the information about the application (its name, version and
+    description). This doesn't change whilst the application is running, so it
+    is computed once and cached.
+    """
     name = agtool.__name__
     version = AppInfoVersion(name=agtool.__version__, date=agtool.__updated__)
     description = agtool.__doc__.strip().split("\n")
     return AppInfo(name=name, version=version, description=description)
 
 
+@functools.cache
 def get_readable_app_info(with_long_description=False) -> str:
     """
     Returns the human-readable version information string (ready to be
@@ -35,7 +95,8 @@ def get_readable_app_info(with_long_description=False) -> str:
 
     :return: The human-readable version string for the application.
     """
-    _, version, description = get_app_info()
+    app_info = get_app_info()
+    version, description = app_info.version, app_info.description
     short_description = description[0]
 
     # Don't bother generating the long description if with_long_description is
@@ -48,17 +109,16 @@ def get_readable_app_info(with_long_description=False) -> str:
 Last Updated: {version.date}""" + long_description
 
 
-def parse_cli_args(args: Sequence[str], default_settings: Optional[dict[str, str]] = None) -> AppConfig:
+@functools.cache
+def _get_parser() -> 'ArgumentParser':
     """
-    Parses the list of command-line arguments to determine the application
-    configuration.
-
-    Requires that the list of arguments be passed in, even if this is just
-    sys.argv to facilitate testing and reduce extraneous code paths.
-
-    :return: An AppConfig object containing the CLI arguments passed to the
-    application.
+    Returns the command-line argument parser for the application. Building the
+    parser (and importing argparse) is relatively expensive, and it is the same
+    for every invocation, so it is only built once (on first use) and then
+    re-used. It is only needed for invocations that the fast path in
+    parse_cli_args cannot handle (e.g., --help or invalid arguments).
     """
+    from argparse import ArgumentParser, RawDescriptionHelpFormatter
 
     parser = ArgumentParser(description=get_readable_app_info(),
                             formatter_class=RawDescriptionHelpFormatter,
@@ -84,7 +144,7 @@ def parse_cli_args(args: Sequence[str], default_settings: Optional[dict[str, str
                       help="lists available plugins, and exits")
 
     # (values are ordered lowest log level to highest)
-    meta.add_argument("-L", '--level', default='INFO',
+    meta.add_argument("-L", '--level', default=_CLI_DEFAULTS['level'],
                       help="sets the minimum log level that will be printed; [default: %(default)s]",
                       choices=AppSupportedLogLevels)
 
@@ -92,10 +152,14 @@ def parse_cli_args(args: Sequence[str], default_settings: Optional[dict[str, str
     # Ordinary program arguments
     # ---
 
-    parser.add_argument('--plugins-dir', default='plugins/',
+    parser.add_argument('--plugins-dir', default=_CLI_DEFAULTS['plugins_dir'],
                         action="store", dest="plugins_dir",
                         help="sets the directory in which to search for plugins; [default: %(default)s]")
 
+    parser.add_argument('--force-refresh-plugins',
+                        action="store_true", dest="force_refresh_plugins",
+                        help="ignores the plugin cache and reloads all plugins from the plugins directory")
+
     # -it and -ot are aliases for --input-type and --output-type, respectively.
     # -if and -of have been avoided to prevent confusion with input and output
     # file arguments.
@@ -104,7 +168,7 @@ def parse_cli_args(args: Sequence[str], default_settings: Optional[dict[str, str
                         help="sets the expected input format (guessed heuristically by default)")
 
     parser.add_argument("-ot", '-ofmt', '--output-type', '--output-format',
-                        action="store", dest="output_format", default='png',
+                        action="store", dest="output_format", default=_CLI_DEFAULTS['output_format'],
                         help="sets the desired output format (guessed heuristically by default)")
 
     parser.add_argument('input', help="sets the input file to read from",
@@ -118,28 +182,110 @@ def parse_cli_args(args: Sequence[str], default_settings: Optional[dict[str, str
                         action="append", dest="options", default=[],
                         help="sets a global option which may be read by agtool or its plugins (e.g., -s key=value)")
 
-    result = parser.parse_args(args)
+    return parser
 
-    # ---
 
-    if not result.override_action and not result.input:
-        parser.error("the following arguments are required: input")
-        exit(1)
+def parse_cli_args(args: Sequence[str], default_settings: Optional[dict[str, str]] = None) -> AppConfig:
+    """
+    Parses the list of command-line arguments to determine the application
+    configuration.
+
+    Requires that the list of arguments be passed in, even if this is just
+    sys.argv to facilitate testing and reduce extraneous code paths.
+
+    :return: An AppConfig object containing the CLI arguments passed to the
+    application.
+    """
+
+    # Most invocations only use the simple options, so try to parse the
+    # arguments without argparse first. If that isn't possible (e.g., for
+    # --help or --version, or if the arguments are invalid), fall back to
+    # the argparse parser, which also handles printing help and errors.
+    result = _parse_cli_args_fast(args)
+
+    if result is None:
+        parser = _get_parser()
+        result = vars(parser.parse_args(args))
+
+        # ---
+
+        if not result['override_action'] and not result['input']:
+            parser.error("the following arguments are required: input")
+            exit(1)
 
     # ---
 
     return AppConfig(
-        override_action=result.override_action,
-        verbosity=result.level,
-        plugins_dir=result.plugins_dir,
-        input_format=result.input_format,
-        output_format=result.output_format,
-        input_file=result.input,
-        output_file=result.output,
-        settings=parse_settings(result.options, defaults=default_settings)
+        override_action=result['override_action'],
+        verbosity=result['level'],
+        plugins_dir=result['plugins_dir'],
+        input_format=result['input_format'],
+        output_format=result['output_format'],
+        input_file=result['input'],
+        output_file=result['output'],
+        settings=parse_settings(result['options'], defaults=default_settings),
+        force_refresh_plugins=result['force_refresh_plugins']
     )
 
 
+def _parse_cli_args_fast(args: Sequence[str]) -> Optional[dict[str, Any]]:
+    """
+    Parses the list of command-line arguments without argparse, for the simple
+    (and common) cases, producing the same result as the argparse parser.
+
+    :return: The parsed arguments (keyed by their destination, as with
+    argparse), or None if the arguments could not be parsed this way, in which
+    case the argparse parser should be used instead.
+    """
+    result = {**_CLI_DEFAULTS, 'options': []}
+    positionals = 0
+
+    index = 0
+    while index < len(args):
+        token = args[index]
+        index += 1
+
+        # Anything that isn't an option is the (single) input file.
+        if not token.startswith('-'):
+            positionals += 1
+            result['input'] = token
+            continue
+
+        # Options that don't take a value.
+        if token in _CLI_FLAG_OPTIONS:
+            dest, const = _CLI_FLAG_OPTIONS[token]
+            result[dest] = const
+            continue
+
+        # Options that take a value, either as the next argument or
+        # following an equals sign (e.g., --level=DEBUG).
+        option, separator, value = token.partition('=')
+        dest = _CLI_VALUE_OPTIONS.get(option)
+        if dest is None:
+            return None
+
+        if not separator:
+            # (argparse would reject values that look like an option.)
+            if index >= len(args) or args[index].startswith('-'):
+                return None
+
+            value = args[index]
+            index += 1
+
+        if dest == 'options':
+            result['options'].append(value)
+        else:
+            result[dest] = value
+
+    # Leave argparse to report any errors.
+    if positionals > 1 \
+            or result['level'] not in AppSupportedLogLevels \
+            or (not result['override_action'] and not result['input']):
+        return None
+
+    return result
+
+
 def parse_settings(value: list[str], defaults: Optional[dict[str, str]] = None) -> dict[str, str]:
     """
     Parses a list of settings (e.g., from the command-line) into a dictionary
@@ -163,21 +309,100 @@ def parse_settings(value: list[str], defaults: Optional[dict[str, str]] = None)
     :return: A dictionary of key-value pairs.
     """
 
-    settings = {}
+    # Start with (a copy of) the defaults, such that the parsed settings are
+    # merged into them as they are parsed. (If there are no settings, that
+    # copy is the result.)
+    settings = dict(defaults) if defaults else {}
+    if not value:
+        return settings
+
     for setting in value:
-        # Split the setting into key and value.
-        key, *value = setting.split('=')
-        value = '='.join(value)
+        # Split the setting into key and value (at the first equals sign). If
+        # the value is not specified, it will be an empty string.
+        key, _, setting_value = setting.partition('=')
 
         key = key.strip()
         if not key:
             raise AGError("Invalid setting: key is empty")
 
-        # Set the value to an empty string if it is not specified.
-        if not value:
-            value = ""
-
         # Add the key-value pair to the settings dictionary.
-        settings[key] = value
+        settings[key] = setting_value
+
+    return settings
+
+
+def _normalize_output_format_and_file(config: AppConfig, logger: LoggerType) -> None:
+    """Normalizes the output when both the output format and file were specified."""
+
+    # If the output_file does not have a file extension, then we'll append the
+    # output_format to the output_file (provided it is not a URI).
+    output_file_ext = extract_extension(config.output_file)
+    if len(output_file_ext) == 0 and _URI_RE.match(config.output_file) is None:
+        config.output_file = replace_file_extension(config.output_file, config.output_format)
+        output_file_ext = config.output_format
+
+    # Otherwise, we'll use the output_file as-is, but provide a warning to the
+    # user if the output_format doesn't match the file extension.
+    if config.output_format != output_file_ext:
+        logger.warning(
+            f"Output file \"{config.output_file}\" does not match the "
+            f"output format \"{config.output_format}\"."
+        )
+
+        logger.warning(
+            f"We'll use the output file name as-is ({config.output_file}) and produce a file "
+            f"with the specified format ({config.output_format}), but this may be unexpected."
+        )
+
 
-    return (defaults or {}) | settings
+def _normalize_output_format_only(config: AppConfig, logger: LoggerType) -> None:
+    """Normalizes the output when only the output format was specified."""
+
+    # We'll just use the input_file with the output_format as the output_file
+    # extension.
+    config.output_file = replace_file_extension(config.input_file, config.output_format)
+
+
+def _normalize_output_file_only(config: AppConfig, logger: LoggerType) -> None:
+    """Normalizes the output when only the output file was specified."""
+
+    # Try to infer the output_format from the file extension. If there isn't
+    # one, we'll throw an error.
+    config.output_format = extract_extension(config.output_file)
+    if len(config.output_format) == 0:
+        raise AGError("No output format specified (and the output filename does not have an extension).")
+
+
+def _normalize_output_unspecified(config: AppConfig, logger: LoggerType) -> None:
+    """Normalizes the output when neither the output format nor file were specified."""
+
+    # This shouldn't happen because a valid output format should be specified
+    # by the CLI parser. But, if the user is using the API, or the parser is
+    # changed, this could happen, so we'll handle it.
+    raise AGError("No output format specified (and no output filename was specified so none could be "
+                  "inferred).")
+
+
+_OUTPUT_NORMALIZERS: dict[tuple[bool, bool], Callable[[AppConfig, LoggerType], None]] = {
+    (True, True): _normalize_output_format_and_file,
+    (True, False): _normalize_output_format_only,
+    (False, True): _normalize_output_file_only,
+    (False, False): _normalize_output_unspecified,
+}
+"""
+The output normalization handlers, keyed by whether the output format and the
+output file (respectively) were specified.
+"""
+
+
+def normalize_output(config: AppConfig, logger: LoggerType) -> None:
+    """
+    Normalizes the output file and format in the given configuration, such
+    that both are set (inferring one from the other, where necessary).
+
+    :param config: The application configuration to normalize (in-place).
+    :param logger: The logger to emit any warnings to.
+    :raises AGError: If neither the output format nor file were specified, or
+    the output format could not be inferred from the output file.
+    """
+    _OUTPUT_NORMALIZERS[(bool(config.output_format), bool(config.output_file))](config, logger)
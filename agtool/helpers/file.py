@@ -1,21 +1,34 @@
+import functools
 import os.path
+import shutil
 import sys
-from typing import Optional, Union
+import tempfile
+from typing import Iterable, Optional, TextIO, Union
 
+STREAM_BUFFER_SIZE = 65536
+"""The buffer size (in bytes) used when streaming data to or from a file."""
 
-def _resolve_path(target: str, working_dir: Optional[str]) -> str:
+
+@functools.lru_cache(maxsize=256)
+def resolve_path(target: str, working_dir: Optional[str] = None) -> str:
     """
-    Resolves the working directory to use for file operations.
+    Resolves the path to use for file operations on the given target (relative
+    to the working directory, if one is specified).
+
+    Resolution depends only on the (immutable) arguments, so the results are
+    cached to avoid repeatedly normalizing the same paths.
     """
 
     # If the working directory is not specified, use the target directory,
     # otherwise, resolve the target relative to the working directory.
-    path = target
-    if working_dir is not None:
-        path = os.path.join(working_dir, target)
+    path = target if working_dir is None else os.path.join(working_dir, target)
+
+    # Normalize the path on Windows (where the case and separators may vary).
+    # On POSIX systems, normcase does nothing and the path can be opened as-is.
+    if os.name == 'nt':
+        path = os.path.normcase(os.path.normpath(path))
 
-    # Normalize the path.
-    return os.path.normcase(os.path.normpath(path))
+    return path
 
 
 def read_file_as_string(file_path: str, working_dir: Optional[str] = None) -> str:
@@ -23,25 +36,37 @@ def read_file_as_string(file_path: str, working_dir: Optional[str] = None) -> st
     Reads the contents of a file as a string.
     """
 
-    with open(_resolve_path(target=file_path, working_dir=working_dir), 'r') as file:
+    with open(resolve_path(target=file_path, working_dir=working_dir), 'r') as file:
         return file.read()
 
 
+def open_file_as_stream(file_path: str, working_dir: Optional[str] = None) -> TextIO:
+    """
+    Opens a file for reading as a (buffered) text stream. The caller is
+    responsible for closing the stream.
+    """
+
+    return open(resolve_path(target=file_path, working_dir=working_dir), 'r', buffering=STREAM_BUFFER_SIZE)
+
+
 def write_file_from_string(file_path: str, contents: str, working_dir: Optional[str] = None) -> None:
     """
     Writes a string to a file.
     """
 
-    with open(_resolve_path(target=file_path, working_dir=working_dir), 'w') as file:
+    with open(resolve_path(target=file_path, working_dir=working_dir), 'w') as file:
         file.write(contents)
 
 
 def read_file_as_bytes(file_path: str, working_dir: Optional[str] = None) -> bytes:
     """
-    Reads the contents of a file as a string.
+    Reads the contents of a file as bytes.
     """
 
-    with open(_resolve_path(target=file_path, working_dir=working_dir), 'rb') as file:
+    # The file is opened unbuffered, so the read goes straight to the raw file,
+    # which sizes its result from the file size and reads it directly into the
+    # returned bytes (rather than copying it through a buffer).
+    with open(resolve_path(target=file_path, working_dir=working_dir), 'rb', buffering=0) as file:
         return file.read()
 
 
@@ -50,29 +75,100 @@ def write_file_from_bytes(file_path: str, contents: bytes, working_dir: Optional
     Writes bytes to a file.
     """
 
-    with open(_resolve_path(target=file_path, working_dir=working_dir), 'wb') as file:
+    with open(resolve_path(target=file_path, working_dir=working_dir), 'wb') as file:
         file.write(contents)
 
 
-def write_file_from_data(file_path: str, contents: Union[str, bytes], working_dir: Optional[str] = None) -> None:
+def write_file_from_chunks(file_path: str,
+                           chunks: Iterable[Union[str, bytes]],
+                           working_dir: Optional[str] = None) -> None:
+    """
+    Writes a sequence of chunks to a file as they are produced, without first
+    joining them in memory. (The chunks must either all be strings or all be
+    bytes, the type of which is inferred from the first chunk.)
+
+    The file is only replaced once all the chunks have been written, so if
+    producing the chunks fails, any existing file is left as it was.
+    """
+
+    # Fetch the first chunk before opening the file, so that the file is not
+    # created (or truncated) if producing the data fails up front.
+    chunks = iter(chunks)
+    first_chunk = next(chunks, b'')
+
+    if isinstance(first_chunk, str):
+        mode = 'w'
+    elif isinstance(first_chunk, bytes):
+        mode = 'wb'
+    else:
+        raise ValueError(f"Invalid file contents. It must be either a string (str) or bytes (bytes), "
+                         f"but was \"{type(first_chunk)}\".")
+
+    # Write to a temporary file (in the same directory) first, then move it
+    # into place, so that the target file is never left partially written if
+    # producing the remaining chunks fails. Symbolic links are resolved first,
+    # so that the file they point to is replaced (rather than the link). The
+    # temporary file is hidden, in case it is left behind (e.g., if the
+    # process is killed).
+    path = os.path.realpath(resolve_path(target=file_path, working_dir=working_dir))
+    directory, file_name = os.path.split(path)
+
+    file = tempfile.NamedTemporaryFile(mode, buffering=STREAM_BUFFER_SIZE, dir=directory,
+                                       prefix=f".{file_name}.", suffix='.tmp', delete=False)
+    temporary_path = file.name
+
+    try:
+        with file:
+            file.write(first_chunk)
+            for chunk in chunks:
+                file.write(chunk)
+
+        # The temporary file is only accessible by the current user, so give
+        # it the permissions of the file it replaces (or, for a new file, the
+        # permissions that open would have given it).
+        if os.path.exists(path):
+            shutil.copymode(path, temporary_path)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temporary_path, 0o666 & ~umask)
+
+        os.replace(temporary_path, path)
+    except BaseException:
+        # Remove the partial file, then re-raise.
+        try:
+            os.unlink(temporary_path)
+        except OSError:
+            pass
+
+        raise
+
+
+def write_file_from_data(file_path: str,
+                         contents: Union[str, bytes, Iterable[Union[str, bytes]]],
+                         working_dir: Optional[str] = None) -> None:
     """
     Writes data to a file. (Data is either a string or bytes, the type of which
-    is inferred from the type of the contents argument.)
+    is inferred from the type of the contents argument, or an iterable of
+    chunks of either, as per `write_file_from_chunks`.)
     """
 
     if isinstance(contents, str):
         write_file_from_string(file_path, contents, working_dir=working_dir)
     elif isinstance(contents, bytes):
         write_file_from_bytes(file_path, contents, working_dir=working_dir)
+    elif isinstance(contents, Iterable):
+        write_file_from_chunks(file_path, contents, working_dir=working_dir)
     else:
         raise ValueError(f"Invalid file contents. It must be either a string (str) or bytes (bytes), "
                          f"but was \"{type(contents)}\".")
 
 
-def write_stdout_from_data(contents: Union[str, bytes]) -> None:
+def write_stdout_from_data(contents: Union[str, bytes, Iterable[Union[str, bytes]]]) -> None:
     """
     Writes data to stdout. (Data is either a string or bytes, the type of which
-    is inferred from the type of the contents argument.)
+    is inferred from the type of the contents argument, or an iterable of
+    chunks of either.)
     """
 
     # Write the contents to stdout, depending on the type of the contents.
@@ -82,6 +178,12 @@ def write_stdout_from_data(contents: Union[str, bytes]) -> None:
         sys.stdout.write(contents)
     elif isinstance(contents, bytes):
         sys.stdout.buffer.write(contents)
+    elif isinstance(contents, Iterable):
+        for chunk in contents:
+            if isinstance(chunk, str):
+                sys.stdout.write(chunk)
+            else:
+                sys.stdout.buffer.write(chunk)
     else:
         raise ValueError(f"Invalid file contents. It must be either a string (str) or bytes (bytes), "
                          f"but was \"{type(contents)}\".")
@@ -96,3 +198,17 @@ def replace_file_extension(filename: str, new_extension: str) -> str:
     """
 
     return f"{os.path.splitext(filename)[0]}{os.extsep}{new_extension}"
+
+
+def extract_extension(path: str) -> str:
+    """
+    Returns the extension of the file at the given path, without the leading
+    extension separator (e.g., 'txt' for 'graph.txt'), or an empty string if
+    the file name does not have an extension.
+
+    As with `os.path.splitext`, leading periods in the file name are ignored
+    (e.g., '.graph' does not have an extension).
+    """
+
+    _, separator, extension = os.path.basename(path).lstrip(os.extsep).rpartition(os.extsep)
+    return extension if separator else ""
@@ -2,12 +2,15 @@
 Simple stub to provide type hints for the logger.
 """
 
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
 
-# noinspection PyProtectedMember
-from loguru._logger import Logger
+# The logger class is only needed for type checking, so loguru is not imported
+# at runtime just to declare the type.
+if TYPE_CHECKING:
+    # noinspection PyProtectedMember
+    from loguru._logger import Logger
 
-LoggerType = TypeVar('LoggerType', bound=Logger)
+LoggerType = TypeVar('LoggerType', bound='Logger')
 """
 The application logger.
 
@@ -1,4 +1,12 @@
+import functools
 import math
+from bisect import bisect_left
+
+_FACTORIALS = [1, 1]
+"""
+The table of factorials computed so far (such that _FACTORIALS[i] = i!). This
+is extended as needed by inverse_factorial.
+"""
 
 
 def inverse_factorial(value: int) -> int:
@@ -8,14 +16,15 @@ def inverse_factorial(value: int) -> int:
     :param value: The integer to compute the inverse factorial of.
     :return: The inverse factorial of `value`.
     """
-    n = 1
-    i = 1
-    while n < value:
-        i += 1
-        n *= i
-    return i
+    # Extend the table of factorials until it covers the value.
+    while _FACTORIALS[-1] < value:
+        _FACTORIALS.append(_FACTORIALS[-1] * len(_FACTORIALS))
+
+    # Then find the smallest i (at least 1) for which i! >= value.
+    return max(bisect_left(_FACTORIALS, value), 1)
 
 
+@functools.lru_cache(maxsize=128)
 def required_permutation_objects(n: int, for_minimum_permutations: int) -> int:
     """
     Returns, for a given number of objects, `n` and a minimum number of total
@@ -29,7 +38,7 @@ def required_permutation_objects(n: int, for_minimum_permutations: int) -> int:
     :return: The number of objects that must permute together to achieve the
         minimum number of permutations.
     """
-    x = math.floor(math.factorial(n) / for_minimum_permutations)
+    x = math.factorial(n) // for_minimum_permutations
 
     if n < 1 or x < 1:
         raise ValueError(f"n is too small to provide the required minimum number of permutations "
@@ -1,5 +1,26 @@
+import functools
 import re
 
+_UPPER_CASE_LETTER_RE = re.compile(r'([A-Z])')
+"""Matches an upper-case letter (i.e., the start of a word in UpperCamelCase)."""
+
+_UNDERSCORED_LETTER_RE = re.compile(r'_([a-z])')
+"""Matches an underscore followed by a letter (i.e., the start of a word in lower_snake_case)."""
+
+_MANY_NEEDLES_THRESHOLD = 8
+"""
+The number of arguments from which string_contains_any_of searches for all of
+the arguments with a single (compiled) regular expression.
+"""
+
+
+def _to_snake_case_word_start(match: re.Match) -> str:
+    return '_' + match.group(1).lower()
+
+
+def _to_camel_case_word_start(match: re.Match) -> str:
+    return match.group(1).upper()
+
 
 def to_lower_snake_case(value: str) -> str:
     """
@@ -11,7 +32,7 @@ def to_lower_snake_case(value: str) -> str:
     if len(value) <= 1:
         return value.lower()
 
-    return value[0].lower() + re.sub(r'([A-Z])', lambda x: x.group()[1].lower(), value)
+    return value[0].lower() + _UPPER_CASE_LETTER_RE.sub(_to_snake_case_word_start, value[1:])
 
 
 def to_upper_camel_case(value: str) -> str:
@@ -24,7 +45,7 @@ def to_upper_camel_case(value: str) -> str:
     if len(value) <= 1:
         return value.upper()
 
-    return value[0].upper() + re.sub(r'_([a-z])', lambda x: x.group()[1].upper(), value[1:])
+    return value[0].upper() + _UNDERSCORED_LETTER_RE.sub(_to_camel_case_word_start, value[1:])
 
 
 def string_contains_any_of(value: str, *args: str, case_insensitive: bool = True) -> bool:
@@ -40,9 +61,25 @@ def string_contains_any_of(value: str, *args: str, case_insensitive: bool = True
     """
     value_normalized = value.lower() if case_insensitive else value
 
+    # For many arguments, search for all of them with a single regular
+    # expression (which only scans the string once), rather than scanning the
+    # string once for each argument.
+    if len(args) >= _MANY_NEEDLES_THRESHOLD:
+        return _compile_any_of_pattern(args, case_insensitive).search(value_normalized) is not None
+
     for arg in args:
         arg_normalized = arg.lower() if case_insensitive else arg
         if arg_normalized in value_normalized:
             return True
 
     return False
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_any_of_pattern(args: tuple[str, ...], case_insensitive: bool) -> re.Pattern:
+    """
+    Compiles a regular expression that matches any of the given arguments
+    (literally). If case_insensitive is set, the arguments are lower-cased (so
+    the string being searched should be too).
+    """
+    return re.compile('|'.join(re.escape(arg.lower() if case_insensitive else arg) for arg in args))
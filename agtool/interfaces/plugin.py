@@ -1,6 +1,7 @@
-from typing import TypeVar
+from typing import Type, TypeVar
 
 from agtool.abstract import AbstractPlugin, AbstractController
+from agtool.helpers.logger import LoggerType
 
 PluginExtensionGeneric = TypeVar('PluginExtensionGeneric')
 """
@@ -35,8 +36,22 @@ class AGPlugin(AbstractPlugin):
         self.controller: AbstractController = controller
         """The application controller"""
 
+        self._cached_logger = None
+        """
+        The logger bound to this plugin's ID, which is created (and cached)
+        by the controller the first time the plugin logs a message.
+        """
+
+    @property
+    def log(self) -> LoggerType:
+        """
+        The logger for this plugin (i.e., the application logger, bound to
+        the plugin's ID).
+        """
+        return self.controller.logger_for(self)
+
     def load_all_extensions(self,
-                            subclass_of: PluginExtensionGeneric) -> list[PluginExtensionGeneric]:
+                            subclass_of: Type[PluginExtensionGeneric]) -> list[Type[PluginExtensionGeneric]]:
         """
         See `agtool.abstract.plugin_registry.AbstractPluginRegistry.load_all_extensions`
         """
@@ -44,7 +59,7 @@ class AGPlugin(AbstractPlugin):
 
     def load_extension_from_file(self,
                                  file: str,
-                                 subclass_of: PluginExtensionGeneric) -> list[PluginExtensionGeneric]:
+                                 subclass_of: Type[PluginExtensionGeneric]) -> list[Type[PluginExtensionGeneric]]:
         """
         See `agtool.abstract.plugin_registry.AbstractPluginRegistry.load_extension_from_file`
         """
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Optional
+from typing import Optional, TextIO
 
 from agtool.interfaces.plugin import AGPlugin
 from agtool.struct.graph import Graph
@@ -29,3 +29,21 @@ class AGReader(AGPlugin):
         :return: Either the graph, if one could be determined from the
         input, or None if the input was empty.
         """
+
+    def read_graph_stream(self, input_source_name: str, input_stream: TextIO) -> Optional[Graph]:
+        """
+        Called to parse a graph from a (text) stream, in the format that this
+        reader implements a parser for.
+
+        Readers that are able to parse their input incrementally should
+        override this to consume the stream in chunks. By default, the stream
+        is read in full and passed to `read_graph`.
+
+        :param input_source_name: The name of the input source (e.g., a file
+        name, or a URL). This is a textual label, generally intended for error
+        messages.
+        :param input_stream: The stream to read the input data from.
+        :return: Either the graph, if one could be determined from the
+        input, or None if the input was empty.
+        """
+        return self.read_graph(input_source_name, input_stream.read())
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Union, Optional
+from typing import Iterable, Union, Optional
 
 from agtool.interfaces.plugin import AGPlugin
 from agtool.struct.graph import Graph
@@ -28,3 +28,24 @@ class AGWriter(AGPlugin):
         :return: The output data (either as a string, in the case of plain text
         formats, or as bytes, in the case of binary formats).
         """
+
+    def write_graph_buffered(self, graph: Graph, destination_label: str) -> Iterable[Union[str, bytes]]:
+        """
+        Called to write a graph to the format that this writer implements a
+        writer for, as a sequence of chunks, so that the output can be written
+        to its destination as it is produced rather than held in memory in
+        full.
+
+        Writers that are able to produce their output incrementally should
+        override this. By default, this yields the output of `write_graph` as
+        a single chunk.
+
+        :param graph: The graph to write.
+        :param destination_label: The name of the output destination
+        (e.g., a file name, or a URL). This is a textual label, generally
+        intended for error messages.
+        :return: The output data as an iterable of chunks (all either strings,
+        in the case of plain text formats, or bytes, in the case of binary
+        formats).
+        """
+        yield self.write_graph(graph, destination_label=destination_label)
@@ -1,3 +1,4 @@
+import sys
 from typing import Optional, Union
 
 from agtool.struct.vertex import Vertex, VertexEdge
@@ -27,7 +28,9 @@ class Graph:
         """
         Returns true if the graph has edges or false if it is empty.
         """
-        return len(self.mappings) > 0
+        # Only sinks are held in the index of incident edges, so this generally
+        # stops at the first list of edges it checks.
+        return any(self._incident.values())
 
     @property
     def mappings(self) -> dict[str, list[VertexEdge]]:
@@ -39,14 +42,13 @@ class Graph:
 
         That is, this is a dictionary mapping where the key is a sink, and the
         value is a list of edges that point into that sink (a list of sources).
-        """
-        edges = {}
-
-        for vertex in self.vertices.values():
-            if vertex.has_dependencies:
-                edges[vertex.name] = vertex.edges
 
-        return edges
+        The mapping is maintained as vertices and edges are added to the graph
+        (so it should not be modified by the caller). For it to remain
+        accurate, edges must be added to vertices in the graph with `add_edge`,
+        rather than by modifying `Vertex.edges` directly.
+        """
+        return self._incident
 
     def __init__(self, known_vertices: Optional[Union[VertexDictionary, list[Vertex]]] = None):
         """
@@ -69,13 +71,50 @@ class Graph:
         the vertex.
         """
 
+        self._incident: dict[str, list[VertexEdge]] = {
+            vertex.name: vertex.edges
+            for vertex in self.vertices.values()
+            if vertex.has_dependencies
+        }
+        """
+        The mapping of sinks to their incident edges (see `mappings`). The
+        lists are those held by the vertices themselves (i.e., `Vertex.edges`).
+        """
+
+        self._lowercase_index: Optional[dict[str, str]] = None
+        """
+        An index of the (lower-cased) names of the vertices in the graph,
+        mapped to the actual names of the vertices, for case-insensitive
+        lookups. This is built on first use (see `has_vertex_with_name`), and
+        then maintained as vertices are added.
+        """
+
     def add_vertex(self, vertex: Vertex):
         """Add a given vertex to the graph."""
-        if vertex not in self.vertices:
+        if vertex.name not in self.vertices:
             self.vertices[vertex.name] = vertex
+            if vertex.has_dependencies:
+                self._incident[vertex.name] = vertex.edges
+
+            if self._lowercase_index is not None:
+                self._lowercase_index[sys.intern(vertex.name.lower())] = vertex.name
         else:
             raise KeyError(f"Vertex, {vertex.name}, already exists in the graph.")
 
+    def add_edge(self, sink_vertex: Vertex, edge: VertexEdge):
+        """
+        Add a given edge, incident to (pointing into) the given sink vertex, to
+        the graph. The sink vertex must already be in the graph.
+
+        This should be used instead of modifying `Vertex.edges` directly for
+        vertices that are in a graph, so that `mappings` remains accurate.
+        """
+        if sink_vertex.name not in self.vertices:
+            raise KeyError(f"Vertex, {sink_vertex.name}, does not exist in the graph.")
+
+        sink_vertex.edges.append(edge)
+        self._incident[sink_vertex.name] = sink_vertex.edges
+
     def has_vertex_with_name(self, vertex_name: str, case_insensitive: bool = False) -> bool:
         """
         Returns true if the graph has a vertex with the given name.
@@ -100,9 +139,12 @@ class Graph:
             # then we can just check if the vertex name is in the dictionary.
             return vertex_name in self.vertices
         else:
-            # Otherwise, we need to check each vertex name in the dictionary
-            # to see if it matches the given vertex name.
-            return any(vertex_name.lower() == vertex_name.lower() for vertex_name in self.vertices)
+            # Otherwise, we check for the lower-cased name in the index of
+            # lower-cased vertex names (building it, if it hasn't been yet).
+            if self._lowercase_index is None:
+                self._lowercase_index = {sys.intern(name.lower()): name for name in self.vertices}
+
+            return vertex_name.lower() in self._lowercase_index
 
     def has_vertex(self, vertex: Vertex):
         """
@@ -116,10 +158,13 @@ class Graph:
         :param vertex: The vertex to check for.
         :return: True if the graph contains the vertex. Otherwise, false.
         """
-        return vertex in self.vertices.values()
+        # Vertices are keyed by their (unique) names, so only the vertex with
+        # the same name needs to be compared. (Vertices with the same name are
+        # equal, so this compares the instances themselves).
+        return self.vertices.get(vertex.name) is vertex
 
     @staticmethod
     def __vertex_list_to_dict(vertices: list[Vertex]):
-        # Use dictionary comprehension to automatically map a vertices into a
-        # dictionary keyed by vertex.name.
-        return {vertex.name: vertex for vertex in vertices}
+        # Pair each vertex with its name and build the dictionary, keyed by
+        # vertex.name, from those pairs in one call (in C).
+        return dict(zip((vertex.name for vertex in vertices), vertices))
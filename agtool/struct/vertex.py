@@ -1,4 +1,5 @@
-from typing import Final, Optional, TypeVar
+import sys
+from typing import Final, Iterator, Optional, TypeVar
 
 _VertexType = TypeVar('_VertexType', bound='Vertex')
 """Workaround for typing.Self on a Vertex in Python < 3.11. Do not use outside of vertex.py"""
@@ -14,6 +15,10 @@ class Vertex:
     edges for that vertex.
     """
 
+    # Graphs may hold a very large number of vertices, so slots are used to
+    # avoid allocating a __dict__ for each one.
+    __slots__ = ('name', 'vertex_type', 'edges', 'attributes')
+
     @property
     def has_dependencies(self) -> bool:
         """
@@ -32,7 +37,11 @@ class Vertex:
         :param name: The (unique) name of the vertex. Vertex names must be
         unique as vertices are considered equal if their names match.
         """
-        self.name: Final[str] = name
+        # Vertex names are interned, as the same name is referenced by the
+        # graph (as a key), by the vertex and, potentially, by many edges.
+        # (Names are converted to plain strings first, as only those can be
+        # interned, and readers may produce subclasses of str).
+        self.name: Final[str] = sys.intern(str(name))
         """The (unique) name of the vertex."""
 
         self.vertex_type: Final[str] = vertex_type
@@ -49,8 +58,29 @@ class Vertex:
         each adjacent vertex. This therefore shows all the incident edges
         (directed into) the current one. (The vertices that the current vertex
         is dependent on).
+
+        If you only need to iterate over the adjacent vertices, `iter_incoming`
+        avoids building the dictionary.
         """
-        return {edge.dependency.name: edge.dependency for edge in self.edges}
+        try:
+            # Edges are usually resolved (i.e., their dependencies are
+            # vertices), so try the direct attribute lookup first...
+            return {edge.dependency.name: edge.dependency for edge in self.edges}
+        except AttributeError:
+            # ...and only fall back to checking each edge if an edge refers to
+            # its dependency by name.
+            return dict(self.iter_incoming())
+
+    def iter_incoming(self) -> Iterator[tuple[str, _VertexType]]:
+        """
+        Iterates over the adjacent vertices (the vertices that the current
+        vertex is dependent on), yielding a (name, vertex) pair for each
+        incident edge. See also `get_incoming`.
+
+        If an edge refers to its dependency by name, rather than by vertex,
+        the name is given in place of the vertex.
+        """
+        return ((edge.dependency_name, edge.dependency) for edge in self.edges)
 
     def is_incoming(self, vertex: _VertexType) -> bool:
         """Checks if the given vertex is incoming to this vertex. See also `is_incoming_name`."""
@@ -78,7 +108,7 @@ class Vertex:
             test_vertex_name = vertex_name.lower()
 
         for edge in self.edges:
-            dependency_name = edge.dependency.name
+            dependency_name = edge.dependency_name
             if case_insensitive:
                 dependency_name = dependency_name.lower()
 
@@ -87,14 +117,27 @@ class Vertex:
 
         return False
 
+    def __eq__(self, other):
+        # Vertices are considered equal if their names match. The names are
+        # interned, so this is usually an identity comparison.
+        if not isinstance(other, Vertex):
+            return NotImplemented
+
+        return self.name == other.name
+
+    def __hash__(self):
+        # Consistent with __eq__. (The hash of the name is cached by the
+        # string itself).
+        return hash(self.name)
+
     def __str__(self, with_edges=False):
         edges_str = ''
 
         # If we want edges included in the output string, we can compute the
         # string for each edge and precede it with a newline if there are any
         # edges.
-        if with_edges and len(self.edges) > 0:
-            edges_str = '\n' + ('\n'.join(list(map(lambda edge: f'{self.name} depends on {edge}', self.edges))))
+        if with_edges and self.edges:
+            edges_str = '\n' + '\n'.join(f'{self.name} depends on {edge}' for edge in self.edges)
 
         # Then we can combine all the relevant properties into a human-readable
         # string.
@@ -117,16 +160,46 @@ class VertexEdge:
     the owning vertex) and its dependency.
     """
 
+    # As with vertices, slots are used to avoid allocating a __dict__ for each
+    # edge.
+    __slots__ = ('dependency', '_label', '_label_str', '_is_recovery', '_is_hidden',
+                 '_group_id', '_unique_group_id', '_is_conjunction')
+
+    @property
+    def label(self) -> Optional[str]:
+        """The label for this edge."""
+        return self._label
+
+    @label.setter
+    def label(self, value: Optional[str]):
+        self._label = value
+
+        # The flags derived from the label are computed once here, rather than
+        # on each access, as they are checked repeatedly when rendering.
+        self._is_recovery = value is not None and 'rec' in value
+        self._is_hidden = value is not None and 'invis' in value
+
+        # Likewise, the (human-readable) label suffix used when the edge is
+        # converted to a string.
+        human_label = "Recovery Method" if value == 'rec' else value
+        self._label_str = f' ({human_label})' if human_label else ''
+
+    @property
+    def dependency_name(self) -> str:
+        """
+        Returns the name of the dependency of this edge (whether the edge
+        refers to its dependency by vertex or by name).
+        """
+        dependency = self.dependency
+        return dependency if isinstance(dependency, str) else dependency.name
+
     @property
     def is_recovery(self) -> bool:
         """
         Returns true if this edge is a recovery method, or false if it is a
         normal method.
         """
-        if self.label is None:
-            return False
-
-        return 'rec' in self.label
+        return self._is_recovery
 
     @property
     def is_conjunction(self) -> bool:
@@ -142,10 +215,7 @@ class VertexEdge:
         Whether the edge should be hidden in the graph. Returns true if it should
         be, or false if it should not be hidden.
         """
-        if self.label is None:
-            return False
-
-        return 'invis' in self.label
+        return self._is_hidden
 
     @property
     def group_id(self) -> Optional[int]:
@@ -202,20 +272,17 @@ class VertexEdge:
             across the entire graph, rather than just the sink (target) vertex.
         """
 
+        if isinstance(dependency, str):
+            dependency = sys.intern(str(dependency))
+
         self.dependency: _VertexReferenceType = dependency
         """A dependency node that points into the owner node via this edge."""
 
         self.label = label
-        """The label for this edge."""
 
         self._group_id = group_id
         self._unique_group_id = unique_group_id
         self._is_conjunction = is_conjunction
 
     def __str__(self):
-        dependency_name = self.dependency if isinstance(self.dependency, str) else self.dependency.name
-
-        human_label = "Recovery Method" if self.label == 'rec' else self.label
-        label_str = f' ({human_label})' if (human_label is not None and human_label != '') else ''
-
-        return f"{dependency_name}{label_str}"
+        return self.dependency_name + self._label_str
@@ -16,4 +16,13 @@ If the path to the plugins directory is kept as it is by default, the path to th
 directory need not be specified when running agtool. However, if the plugins directory is
 moved, or you would like to store plugins elsewhere, you can specify the path to the
 plugins directory using the `--plugins-dir` command-line argument.
+
+Plugins can also be distributed as installed Python packages, in which case they do not
+need to be placed in the plugins directory. Such packages should declare each plugin
+class as an entry point in the `agtool.plugins` group, for example (in `pyproject.toml`):
+
+```toml
+[project.entry-points."agtool.plugins"]
+my_reader = "my_package.my_module:MyReader"
+```
 """
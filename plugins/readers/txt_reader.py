@@ -182,19 +182,19 @@ class AGTxtReader(AGReader):
         super().__init__(controller)
 
         # Compile the model and Abstract Syntax Tree.
-        self.controller.logger.debug("Compiling text file grammar model...")
+        self.log.debug("Compiling text file grammar model...")
         self.model = tatsu.compile(AGTxtReader.__GRAMMAR)
-        self.controller.logger.debug("Finished text file compiling grammar model...")
+        self.log.debug("Finished text file compiling grammar model...")
 
     def read_graph(self, input_source_name: str, input_data: str) -> Optional[Graph]:
         ast: Optional
 
-        self.controller.logger.info(f"Parsing {input_source_name} as agtool format...")
+        self.log.info(f"Parsing {input_source_name} as agtool format...")
 
         try:
             ast = self.model.parse(input_data)
         except FailedParse as ex:
-            self.controller.logger.debug("Parser error:\n" + str(ex))
+            self.log.debug("Parser error:\n" + str(ex))
 
             line_info = ex.tokenizer.line_info(ex.pos)
 
@@ -206,7 +206,7 @@ class AGTxtReader(AGReader):
             ).with_traceback(None) from None
 
         if ast is None:
-            self.controller.logger.warning(f"{input_source_name} is empty... Producing empty graph.")
+            self.log.warning(f"{input_source_name} is empty... Producing empty graph.")
             return None
 
         # Store the parsed information.
@@ -416,7 +416,7 @@ class AGTxtReader(AGReader):
 
                 case _:
                     # Display a warning for an unrecognized expression.
-                    self.controller.logger.warning(
+                    self.log.warning(
                         f"Unrecognized expression type on line {line.parseinfo.line} "
                         f"in model: {line.expression_type}"
                     )
@@ -456,11 +456,11 @@ class AGTxtReader(AGReader):
         # characters for quick visual inspection.
         if self.controller.debug:
             for vertex in known_vertices.values():
-                self.controller.logger.debug(f"Vertex :: {vertex}")
+                self.log.debug(f"Vertex :: {vertex}")
 
                 for edge in vertex.edges:
                     draw_char = '  ├' if edge is not vertex.edges[-1] else '  └'
-                    self.controller.logger.debug(f"{draw_char}── requires :: {edge}")
+                    self.log.debug(f"{draw_char}── requires :: {edge}")
 
         # Insert the known_vertices into a Graph object and return it. Though
         # known_vertices is a list, the constructor for Graph will accept this
@@ -74,12 +74,12 @@ class _AGGraphvizConverter(AGWriter, ABC):
 
         # Use the GraphViz command-line tool to render the DOT file as a PNG file.
         try:
-            self.controller.logger.info(f"Rendering DOT file as {self.default_file_extension.upper()} file...")
+            self.log.info(f"Rendering DOT file as {self.default_file_extension.upper()} file...")
             result = subprocess.run(['dot', f'-T{self.default_file_extension}'], capture_output=True, input=dot_data)
 
             if result.returncode != 0:
                 if len(result.stderr) > 0:
-                    self.controller.logger.error(result.stderr.decode("utf-8"))
+                    self.log.error(result.stderr.decode("utf-8"))
 
                 raise AGPluginExternalError(
                     plugin_id=self.id,
@@ -88,7 +88,7 @@ class _AGGraphvizConverter(AGWriter, ABC):
                                 f"({result.returncode}).",
                 )
 
-            self.controller.logger.success("Rendering completed successfully.")
+            self.log.success("Rendering completed successfully.")
 
             return result.stdout
         except FileNotFoundError:
@@ -5,7 +5,7 @@ import string
 from abc import abstractmethod, ABC
 from binascii import crc32
 from collections import deque
-from typing import Optional, Type, TypeVar, Final
+from typing import Iterator, Optional, Type, TypeVar, Final
 
 from agtool.abstract import AbstractController
 from agtool.error import AGPluginExternalError
@@ -140,6 +140,20 @@ class AGGraphvizWriter(AGWriter):
         intended for error messages.
         :return: The output data (as a string).
         """
+        return "".join(self.write_graph_buffered(graph, destination_label=destination_label))
+
+    def write_graph_buffered(self, graph: Graph, destination_label: str) -> Iterator[str]:
+        """
+        Called to write a graph to a Graphviz DOT file, as a sequence of chunks
+        (the file header, followed by each node and edge statement in turn) so
+        that the DOT file need not be held in memory in full.
+
+        :param graph: The graph to write.
+        :param destination_label: The name of the output destination
+        (e.g., a file name, or a URL). This is a textual label, generally
+        intended for error messages.
+        :return: The output data (as an iterator of strings).
+        """
 
         # Check if the user wants to list the available themes.
         should_list_themes = (self.controller.settings['theme'].strip().lower() in ['-l', '--list', '?', '--help']) \
@@ -158,14 +172,14 @@ class AGGraphvizWriter(AGWriter):
                 and requested_theme_name \
                 and not should_list_themes \
                 and requested_theme_name not in ["false", "none"]:
-            self.controller.logger.info(f"Searching for theme \"{requested_theme_name}\"...")
+            self.log.info(f"Searching for theme \"{requested_theme_name}\"...")
 
             # Search through all the identified theme classes for one with a name that matches the theme specified
             # by the user.
             for theme_class in self.themes:
                 if theme_class.name().lower() == requested_theme_name:
                     theme = theme_class(self, graph)
-                    self.controller.logger.success(f"Located theme \"{theme_class.name()}\" successfully.")
+                    self.log.success(f"Located theme \"{theme_class.name()}\" successfully.")
                     break
 
             # If we couldn't find a theme, raise an error.
@@ -178,20 +192,20 @@ class AGGraphvizWriter(AGWriter):
         # Otherwise, if a theme has been specified, but it is empty, or equal to "false" or "none", we'll just use the
         # default theme.
         elif not should_list_themes or not requested_theme_name:
-            self.controller.logger.warning("No theme specified for graph. "
-                                           "No styling (semantic or aesthetic) will be applied.")
+            self.log.warning("No theme specified for graph. "
+                             "No styling (semantic or aesthetic) will be applied.")
 
         # Finally, if the user wants to list the available themes, we'll do that.
         else:
-            self.controller.logger.info("")
-            self.controller.logger.info("Listing available themes...")
+            self.log.info("")
+            self.log.info("Listing available themes...")
 
             if not self.themes:
-                self.controller.logger.info("    No themes are available.")
+                self.log.info("    No themes are available.")
             else:
                 longest_theme_name = max([len(theme_class.name()) for theme_class in self.themes])
 
-                self.controller.logger.info("")
+                self.log.info("")
                 for theme_class in self.themes:
                     theme_entry = f"    {theme_class.name().ljust(longest_theme_name + 4, ' ')}"
                     theme_blank = " " * len(theme_entry)
@@ -203,18 +217,18 @@ class AGGraphvizWriter(AGWriter):
                     ]) if theme_features_dict else "None"
 
                     theme_description_lines = deque(theme_class.description().split('\n'))
-                    self.controller.logger.info(f"{theme_entry} - {theme_description_lines.popleft()}")
+                    self.log.info(f"{theme_entry} - {theme_description_lines.popleft()}")
 
                     for line in theme_description_lines:
-                        self.controller.logger.info(f"{theme_blank} - {line}")
+                        self.log.info(f"{theme_blank} - {line}")
 
-                    self.controller.logger.info(f"{' ' * len(theme_entry)}   Supported settings: {theme_features}")
-                    self.controller.logger.info("")
+                    self.log.info(f"{' ' * len(theme_entry)}   Supported settings: {theme_features}")
+                    self.log.info("")
 
             # We don't need to do anything else.
             self.controller.shutdown()
 
-        self.controller.logger.debug("Parsing theme settings...")
+        self.log.debug("Parsing theme settings...")
 
         # Validate any specified theme settings.
         if theme:
@@ -229,7 +243,7 @@ class AGGraphvizWriter(AGWriter):
                                         f"\"{self.controller.settings[f'theme.{feature}']}\"."
                         )
 
-        self.controller.logger.info("Creating GraphViz DOT file for graph...")
+        self.log.info("Creating GraphViz DOT file for graph...")
 
         # Initialize the statistics for each vertex.
         statistics = {
@@ -245,22 +259,10 @@ class AGGraphvizWriter(AGWriter):
         # Compute the Graphviz attributes for rendering the graph.
         graph_attributes = AGGraphvizWriter._compute_graph_attributes(theme)
 
-        # Compute the DOT nodes and edges for the graph, based on those in the
-        # agtool graph data structure.
-        nodes = AGGraphvizWriter._compute_dot_nodes(controller=self.controller,
-                                                    graph=graph,
-                                                    theme=theme)
-
-        edges = AGGraphvizWriter._compute_dot_edges(graph=graph,
-                                                    statistics=statistics,
-                                                    theme=theme)
-
         if not graph:
-            self.controller.logger.warning("The graph is empty, so an empty DOT graph has been generated.")
-
-        self.controller.logger.success("GraphViz DOT representation created successfully.")
+            self.log.warning("The graph is empty, so an empty DOT graph has been generated.")
 
-        return f"""
+        yield f"""
 // GraphViz .dot file generated by agtool {self.controller.version}
 // on {self.controller.timestamp}.
         
@@ -272,17 +274,32 @@ digraph {graph_name} {{
     // -----------------------------------------------------------------------
 
     // Declare the set of nodes in the graph with attributes.
-    {nodes.strip()}
+""".lstrip()  # Strip any leading whitespace.
 
+        # Compute the DOT nodes and edges for the graph, based on those in the
+        # agtool graph data structure (emitting each one as it is computed).
+        for node in AGGraphvizWriter._iter_dot_nodes(controller=self.controller,
+                                                     graph=graph,
+                                                     theme=theme):
+            yield f"{node}\n"
+
+        yield """
     // -----------------------------------------------------------------------
     // Edges
     // -----------------------------------------------------------------------
 
     // Specify the set of edges from the graph.
-    {edges.strip()}
-}}
+"""
+
+        for edge in AGGraphvizWriter._iter_dot_edges(graph=graph,
+                                                     statistics=statistics,
+                                                     theme=theme):
+            yield f"{edge}\n"
 
-""".lstrip()  # Leave a blank line at the end, but strip any leading whitespace.
+        # Leave a blank line at the end.
+        yield "}\n\n"
+
+        self.log.success("GraphViz DOT representation created successfully.")
 
     @staticmethod
     def _compute_graph_attributes(theme: Optional[_ThemeType] = None) -> str:
@@ -300,20 +317,19 @@ digraph {graph_name} {{
         return AGGraphvizWriter._dict_to_graphviz_attributes(graph_attributes, statements=True)
 
     @staticmethod
-    def _compute_dot_nodes(controller: AbstractController,
-                           graph: Optional[Graph],
-                           theme: Optional[_ThemeType] = None) -> str:
+    def _iter_dot_nodes(controller: AbstractController,
+                        graph: Optional[Graph],
+                        theme: Optional[_ThemeType] = None) -> Iterator[str]:
         """
         Computes the DOT nodes for the given graph.
 
         :param graph: The graph to compute the DOT nodes for.
-        :return: The DOT nodes for the given graph.
+        :return: An iterator over the DOT nodes (lines) for the given graph.
         """
 
         if not graph or not graph.has_vertices:
-            return "    // (!) No nodes in graph."
-
-        nodes = []
+            yield "    // (!) No nodes in graph."
+            return
 
         counter = 0
         """The number of vertices that have been rendered."""
@@ -419,33 +435,31 @@ digraph {graph_name} {{
             # Serialize the attributes to a string.
             attributes = AGGraphvizWriter._dict_to_graphviz_attributes(node_attributes)
 
-            nodes.append(f"    {vertex_name} [{attributes}];")
+            yield f"    {vertex_name} [{attributes}];"
             counter += 1
 
-        return "\n".join(nodes)
-
     @staticmethod
-    def _compute_dot_edges(graph: Optional[Graph],
-                           statistics: dict[str, AGGraphvizVertexStatistics],
-                           theme: Optional[_ThemeType] = None) -> str:
+    def _iter_dot_edges(graph: Optional[Graph],
+                        statistics: dict[str, AGGraphvizVertexStatistics],
+                        theme: Optional[_ThemeType] = None) -> Iterator[str]:
         """
         Computes the DOT edges for the given graph.
 
         :param graph: The graph to compute the DOT edges for.
-        :return: The DOT edges for the given graph.
+        :return: An iterator over the DOT edges (lines) for the given graph.
         """
 
         # If the graph is empty, we'll show that there are no nodes in the graph.
         # (and thus no edges).
         if not graph or not graph.has_vertices:
-            return "    // (!) No nodes in graph (and thus no edges!)."
+            yield "    // (!) No nodes in graph (and thus no edges!)."
+            return
 
         # If the graph has no edges, but does have nodes, we'll show that there
         # are no edges in the graph.
         if not graph.has_edges:
-            return "    // (!) No edges in graph."
-
-        edges = []
+            yield "    // (!) No edges in graph."
+            return
 
         for sink_name, sink_edges in graph.mappings.items():
             for edge in sink_edges:
@@ -462,7 +476,7 @@ digraph {graph_name} {{
                 # Serialize the attributes to a string.
                 attributes = AGGraphvizWriter._dict_to_graphviz_attributes(edge_attributes)
 
-                edges.append(f"    {edge.dependency.name} -> {sink_name} [{attributes}];")
+                yield f"    {edge.dependency.name} -> {sink_name} [{attributes}];"
 
                 # Increment the outgoing edge index for the source vertex.
                 # noinspection PyProtectedMember
@@ -472,8 +486,6 @@ digraph {graph_name} {{
                 # noinspection PyProtectedMember
                 statistics[sink_name]._incoming_edge_index += 1
 
-        return "\n".join(edges)
-
     @staticmethod
     def _dict_to_graphviz_attributes(attributes: dict[str, str], statements: bool = False) -> str:
         """
@@ -108,14 +108,14 @@ class AGGraphvizThemeSimple(AGGraphvizWriterTheme):
         if int(group_id / len(self.scheme)) > 0:
             # TODO: should this raise an error instead?
 
-            self.plugin.controller.logger.warning(f"There were more groups than colors in the color scheme. "
-                                                  f"The color scheme has wrapped around. This may cause confusion.")
+            self.plugin.log.warning(f"There were more groups than colors in the color scheme. "
+                                    f"The color scheme has wrapped around. This may cause confusion.")
 
             # This message will repeat every time we call this function after we're out of colors.
-            self.plugin.controller.logger.warning(f"Consider using a different theme, or increasing the number of "
-                                                  f"colors in the color scheme. There are currently "
-                                                  f"{len(self.scheme)} colors in the color scheme, but we needed "
-                                                  f"{group_id + 1}.")
+            self.plugin.log.warning(f"Consider using a different theme, or increasing the number of "
+                                    f"colors in the color scheme. There are currently "
+                                    f"{len(self.scheme)} colors in the color scheme, but we needed "
+                                    f"{group_id + 1}.")
 
         return self.scheme[group_id % len(self.scheme)]
 
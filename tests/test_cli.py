@@ -0,0 +1,48 @@
+import unittest
+
+from agtool.helpers.cli import _get_parser, _parse_cli_args_fast, parse_cli_args
+
+
+class ParseCliArgsFastTest(unittest.TestCase):
+    """Tests for `agtool.helpers.cli._parse_cli_args_fast`."""
+
+    def test_matches_argparse(self):
+        for args in [
+            ['graph.txt'],
+            ['graph.txt', '-ot', 'dot', '-o', 'graph.dot'],
+            ['-it', 'txt', '--output-format', 'svg', 'graph'],
+            ['-L', 'DEBUG', 'graph.txt'],
+            ['--level=WARNING', 'graph.txt'],
+            ['-P'],
+            ['-P', '-ot', 'json'],
+            ['graph.txt', '-s', 'theme=chi', '--set', 'labels=name', '--set-option=key=value'],
+            ['--plugins-dir', 'other-plugins', '--force-refresh-plugins', 'graph.txt'],
+        ]:
+            with self.subTest(args=args):
+                self.assertEqual(_parse_cli_args_fast(args), vars(_get_parser().parse_args(args)))
+
+    def test_falls_back_to_argparse(self):
+        for args in [
+            [],
+            ['--help'],
+            ['-V'],
+            ['graph.txt', '--unknown'],
+            ['graph.txt', 'other.txt'],
+            ['-L', 'NOT_A_LEVEL', 'graph.txt'],
+            ['graph.txt', '-o', '-'],
+            ['graph.txt', '-stheme=chi'],
+            ['graph.txt', '-o'],
+        ]:
+            with self.subTest(args=args):
+                self.assertIsNone(_parse_cli_args_fast(args))
+
+    def test_parse_cli_args_uses_argparse_fallback(self):
+        config = parse_cli_args(['graph.txt', '-o', '-', '-stheme=chi'])
+
+        self.assertEqual(config.input_file, 'graph.txt')
+        self.assertEqual(config.output_file, '-')
+        self.assertEqual(config.settings, {'theme': 'chi'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import stat
+import tempfile
+import unittest
+
+from agtool.helpers.file import extract_extension, write_file_from_chunks
+
+
+class WriteFileFromChunksTest(unittest.TestCase):
+    """Tests for `agtool.helpers.file.write_file_from_chunks`."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'output.dot')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_writes_all_chunks(self):
+        write_file_from_chunks(self.path, iter(['digraph {', '\n', '}']))
+
+        with open(self.path) as file:
+            self.assertEqual(file.read(), 'digraph {\n}')
+
+    def test_failing_generator_keeps_existing_file(self):
+        with open(self.path, 'w') as file:
+            file.write('existing contents')
+
+        def chunks():
+            yield 'digraph {'
+            raise RuntimeError('failed to render an edge')
+
+        with self.assertRaises(RuntimeError):
+            write_file_from_chunks(self.path, chunks())
+
+        # The existing file is left untouched, and no partial (temporary)
+        # file is left behind.
+        with open(self.path) as file:
+            self.assertEqual(file.read(), 'existing contents')
+
+        self.assertEqual(os.listdir(self.directory.name), ['output.dot'])
+
+    def test_failing_generator_does_not_create_file(self):
+        def chunks():
+            yield b'\x00'
+            raise RuntimeError('failed to render')
+
+        with self.assertRaises(RuntimeError):
+            write_file_from_chunks(self.path, chunks())
+
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_writes_through_symlink(self):
+        target_path = os.path.join(self.directory.name, 'target.dot')
+        with open(target_path, 'w') as file:
+            file.write('existing contents')
+        os.symlink(target_path, self.path)
+
+        write_file_from_chunks(self.path, iter(['digraph {', '}']))
+
+        # The link is kept, and the file that it points to is replaced.
+        self.assertTrue(os.path.islink(self.path))
+        with open(target_path) as file:
+            self.assertEqual(file.read(), 'digraph {}')
+
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ['output.dot', 'target.dot'])
+
+    def test_keeps_permissions_of_existing_file(self):
+        with open(self.path, 'w') as file:
+            file.write('existing contents')
+        os.chmod(self.path, 0o640)
+
+        write_file_from_chunks(self.path, iter(['digraph {}']))
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o640)
+
+    def test_new_file_has_default_permissions(self):
+        umask = os.umask(0o022)
+        try:
+            write_file_from_chunks(self.path, iter(['digraph {}']))
+        finally:
+            os.umask(umask)
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o644)
+
+
+class ExtractExtensionTest(unittest.TestCase):
+    """Tests for `agtool.helpers.file.extract_extension`."""
+
+    def test_matches_splitext(self):
+        for path in ['graph.txt', 'graph.tar.gz', 'graph', '.graph', '..graph', '.graph.txt', 'graph.',
+                     'dir.d/graph', 'dir.d/graph.dot', '/tmp/.hidden/graph.TXT', '', '.', '..']:
+            with self.subTest(path=path):
+                self.assertEqual(extract_extension(path), os.path.splitext(path)[1][1:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from agtool.struct.graph import Graph
+from agtool.struct.vertex import Vertex
+
+
+class HasVertexWithNameTest(unittest.TestCase):
+    """Tests for `agtool.struct.graph.Graph.has_vertex_with_name`."""
+
+    def setUp(self):
+        self.graph = Graph([Vertex('Attacker', 'actor'), Vertex('rootShell', 'goal')])
+
+    def test_case_sensitive(self):
+        self.assertTrue(self.graph.has_vertex_with_name('Attacker'))
+        self.assertFalse(self.graph.has_vertex_with_name('attacker'))
+        self.assertFalse(self.graph.has_vertex_with_name('Missing'))
+
+    def test_case_insensitive(self):
+        for name in ['Attacker', 'attacker', 'ATTACKER', 'rootshell', 'RootShell']:
+            with self.subTest(name=name):
+                self.assertTrue(self.graph.has_vertex_with_name(name, case_insensitive=True))
+
+        self.assertFalse(self.graph.has_vertex_with_name('Missing', case_insensitive=True))
+
+    def test_case_insensitive_after_add_vertex(self):
+        # Build the lower-cased index first, so that it must be updated as
+        # vertices are added.
+        self.assertFalse(self.graph.has_vertex_with_name('password', case_insensitive=True))
+
+        self.graph.add_vertex(Vertex('Password', 'credential'))
+
+        self.assertTrue(self.graph.has_vertex_with_name('password', case_insensitive=True))
+        self.assertTrue(self.graph.has_vertex_with_name('PASSWORD', case_insensitive=True))
+        self.assertFalse(self.graph.has_vertex_with_name('password'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import math
+import unittest
+
+from agtool.helpers.numeric import inverse_factorial
+
+
+def _reference_inverse_factorial(value: int) -> int:
+    # The smallest i (at least 1) for which i! >= value, computed directly.
+    i = 1
+    while math.factorial(i) < value:
+        i += 1
+    return i
+
+
+class InverseFactorialTest(unittest.TestCase):
+    """Tests for `agtool.helpers.numeric.inverse_factorial`."""
+
+    def test_matches_reference(self):
+        for value in range(-1, 5050):
+            with self.subTest(value=value):
+                self.assertEqual(inverse_factorial(value), _reference_inverse_factorial(value))
+
+    def test_factorials_and_neighbours(self):
+        for n in range(1, 40):
+            factorial = math.factorial(n)
+            for value in (factorial - 1, factorial, factorial + 1):
+                with self.subTest(value=value):
+                    self.assertEqual(inverse_factorial(value), _reference_inverse_factorial(value))
+
+    def test_large_value_after_small_values(self):
+        # The table of factorials is shared between calls, so it must extend
+        # correctly after smaller lookups.
+        inverse_factorial(3)
+        self.assertEqual(inverse_factorial(math.factorial(60)), 60)
+        self.assertEqual(inverse_factorial(math.factorial(60) + 1), 61)
+
+
+if __name__ == '__main__':
+    unittest.main()
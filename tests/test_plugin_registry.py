@@ -0,0 +1,188 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from typing import Optional
+from unittest import mock
+
+from agtool.config import AppConfig
+from agtool.core import Controller
+from agtool.core.plugin_registry import _write_table
+from agtool.helpers.cli import get_app_info
+from agtool.interfaces.writer import AGWriter
+
+_WRITER_PLUGIN_SOURCE = '''
+from agtool.interfaces.writer import AGWriter
+
+
+class {class_name}(AGWriter):
+
+    @property
+    def default_file_extension(self) -> str:
+        return '{file_format}'
+
+    def write_graph(self, graph, destination_label: str) -> str:
+        return ''
+'''
+
+
+class PluginCacheTest(unittest.TestCase):
+    """Tests for the plugin cache used by `agtool.core.plugin_registry.AGPluginRegistry`."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_home = os.path.join(self.directory.name, 'cache')
+        self.plugins_dir = os.path.join(self.directory.name, 'plugins')
+        os.makedirs(self.plugins_dir)
+
+        self.write_plugin('alpha_writer.py', 'AGAlphaWriter', 'alpha')
+        self.write_plugin('beta_writer.py', 'AGBetaWriter', 'beta')
+
+        environment = mock.patch.dict(os.environ, {'XDG_CACHE_HOME': self.cache_home})
+        environment.start()
+        self.addCleanup(environment.stop)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_plugin(self, file_name: str, class_name: str, file_format: str, plugins_dir: Optional[str] = None):
+        with open(os.path.join(plugins_dir or self.plugins_dir, file_name), 'w') as file:
+            file.write(_WRITER_PLUGIN_SOURCE.format(class_name=class_name, file_format=file_format))
+
+    def boot(self, force_refresh: bool = False, plugins_dir: Optional[str] = None):
+        # Each boot stands in for a separate run of the application, so
+        # discard the plugin modules imported by any previous boot.
+        for module_name in [name for name in sys.modules if name.startswith('agtool._plugins')]:
+            del sys.modules[module_name]
+
+        controller = Controller(get_app_info(),
+                                AppConfig(input_file='graph.txt',
+                                          verbosity='CRITICAL',
+                                          plugins_dir=plugins_dir or self.plugins_dir,
+                                          force_refresh_plugins=force_refresh),
+                                standalone=True)
+        controller.boot()
+        return controller.plugins
+
+    def cache_files(self):
+        return os.listdir(os.path.join(self.cache_home, 'agtool'))
+
+    def test_cold_boot_loads_all_plugins_and_writes_cache(self):
+        plugins = self.boot()
+
+        self.assertIsNotNone(plugins.get_plugin_for_format(AGWriter, 'alpha'))
+        self.assertIsNotNone(plugins.get_plugin_for_format(AGWriter, 'beta'))
+        self.assertEqual(len(self.cache_files()), 1)
+
+    def test_warm_boot_loads_plugins_on_demand(self):
+        self.boot()
+        plugins = self.boot()
+
+        # Nothing is loaded until it is requested, but the formats of the
+        # indexed plugins are still known.
+        self.assertIsNone(plugins.get_plugin_for_format(AGWriter, 'alpha'))
+        self.assertEqual(plugins.get_formats_of_type(AGWriter), ['alpha', 'beta'])
+
+        self.assertTrue(plugins.load_plugins_of_format(AGWriter, 'ALPHA'))
+        self.assertIsNotNone(plugins.get_plugin_for_format(AGWriter, 'alpha'))
+        self.assertIsNone(plugins.get_plugin_for_format(AGWriter, 'beta'))
+
+    def test_warm_boot_enumerates_all_plugins(self):
+        self.boot()
+        plugins = self.boot()
+
+        self.assertEqual(sorted(plugin.id for plugin in plugins.get_all_plugins()), ['agalphawriter', 'agbetawriter'])
+        self.assertEqual(len(plugins.get_plugins_of_type(AGWriter)), 2)
+        self.assertEqual(len(json.loads(plugins.render_plugins_json())['AGWriter']), 2)
+
+    def test_changed_and_removed_files_invalidate_cache(self):
+        self.boot()
+
+        self.write_plugin('alpha_writer.py', 'AGAlphaWriter', 'alpha2')
+        os.unlink(os.path.join(self.plugins_dir, 'beta_writer.py'))
+        plugins = self.boot()
+
+        # The changed file is loaded immediately, and the removed file is
+        # dropped from the index.
+        self.assertIsNotNone(plugins.get_plugin_for_format(AGWriter, 'alpha2'))
+        self.assertEqual(plugins.get_formats_of_type(AGWriter), ['alpha2'])
+
+        # The refreshed index is written back to the cache.
+        self.assertEqual(self.boot().get_formats_of_type(AGWriter), ['alpha2'])
+
+    def test_force_refresh_ignores_cache(self):
+        self.boot()
+        plugins = self.boot(force_refresh=True)
+
+        self.assertIsNotNone(plugins.get_plugin_for_format(AGWriter, 'alpha'))
+        self.assertIsNotNone(plugins.get_plugin_for_format(AGWriter, 'beta'))
+
+    def test_separate_cache_per_plugins_dir(self):
+        # A sibling directory that shares the plugins directory's prefix.
+        sibling_plugins_dir = self.plugins_dir + '2'
+        os.makedirs(sibling_plugins_dir)
+        self.write_plugin('gamma_writer.py', 'AGGammaWriter', 'gamma', plugins_dir=sibling_plugins_dir)
+
+        self.boot(plugins_dir=sibling_plugins_dir)
+        self.boot()
+        self.assertEqual(len(self.cache_files()), 2)
+
+        # Each cache only holds the files in its own plugins directory.
+        for cache_file in self.cache_files():
+            with open(os.path.join(self.cache_home, 'agtool', cache_file)) as file:
+                cache = json.load(file)
+
+            with self.subTest(plugins_dir=cache['plugins_dir']):
+                for file_path in [*cache['files'], *cache['sources']]:
+                    self.assertTrue(file_path.startswith(cache['plugins_dir'] + os.sep))
+
+        self.assertEqual(self.boot(plugins_dir=sibling_plugins_dir).get_formats_of_type(AGWriter), ['gamma'])
+        self.assertEqual(self.boot().get_formats_of_type(AGWriter), ['alpha', 'beta'])
+
+
+class WriteTableTest(unittest.TestCase):
+    """Tests for `agtool.core.plugin_registry._write_table`."""
+
+    @staticmethod
+    def render(rows) -> str:
+        out = io.StringIO()
+        _write_table(rows, out)
+        return out.getvalue()
+
+    def test_matches_rounded_outline(self):
+        # (As rendered by tabulate with tablefmt='rounded_outline').
+        self.assertEqual(
+            self.render([['ID', 'Type', 'Name'], ['agtxtreader', 'AGReader', None], ['a', 'AGWriter', 'Ünïcode']]),
+            '╭─────────────┬──────────┬─────────╮\n'
+            '│ ID          │ Type     │ Name    │\n'
+            '├─────────────┼──────────┼─────────┤\n'
+            '│ agtxtreader │ AGReader │         │\n'
+            '│ a           │ AGWriter │ Ünïcode │\n'
+            '╰─────────────┴──────────┴─────────╯'
+        )
+
+    def test_header_only(self):
+        self.assertEqual(
+            self.render([['ID', 'Type']]),
+            '╭──────┬────────╮\n'
+            '│ ID   │ Type   │\n'
+            '├──────┼────────┤\n'
+            '╰──────┴────────╯'
+        )
+
+    def test_numeric_values_are_written_verbatim(self):
+        self.assertEqual(
+            self.render([['ID', 'Version'], ['a', '1.0'], ['bb', '12']]),
+            '╭──────┬───────────╮\n'
+            '│ ID   │ Version   │\n'
+            '├──────┼───────────┤\n'
+            '│ a    │ 1.0       │\n'
+            '│ bb   │ 12        │\n'
+            '╰──────┴───────────╯'
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
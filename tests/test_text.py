@@ -0,0 +1,29 @@
+import unittest
+
+from agtool.helpers.text import to_lower_snake_case, to_upper_camel_case
+
+
+class ToLowerSnakeCaseTest(unittest.TestCase):
+    """Tests for `agtool.helpers.text.to_lower_snake_case`."""
+
+    def test_converts_upper_camel_case(self):
+        for value, expected in [
+            ('', ''),
+            ('A', 'a'),
+            ('Graph', 'graph'),
+            ('AttackGraph', 'attack_graph'),
+            ('AGReader', 'a_g_reader'),
+            ('graphVizWriter', 'graph_viz_writer'),
+            ('already_snake', 'already_snake'),
+        ]:
+            with self.subTest(value=value):
+                self.assertEqual(to_lower_snake_case(value), expected)
+
+    def test_round_trips_with_to_upper_camel_case(self):
+        for value in ['Graph', 'AttackGraph', 'GraphVizWriter']:
+            with self.subTest(value=value):
+                self.assertEqual(to_upper_camel_case(to_lower_snake_case(value)), value)
+
+
+if __name__ == '__main__':
+    unittest.main()